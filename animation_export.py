@@ -0,0 +1,168 @@
+"""
+Lorenz Attractor Visualizer - Animation Export
+Attractor animation frames rendered offscreen with Agg on a process pool, saved as GIF, APNG or PNG sequence
+"""
+
+import os
+import time
+import shutil
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+from chaos_core import CompactTrajectory
+from trajectory_store import save_trajectory, open_trajectory
+from density_render import trajectory_bounds
+
+# Output format by file extension; '.png' writes one numbered file per frame
+EXPORT_FORMATS = {'.gif': 'gif', '.apng': 'apng', '.png': 'png'}
+
+
+def export_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXPORT_FORMATS:
+        raise ValueError(f"Cannot export to '{extension}' files, expected one of {', '.join(EXPORT_FORMATS)}")
+    return EXPORT_FORMATS[extension]
+
+
+def frame_positions(n_samples, samples_per_frame):
+    """Number of samples shown by each frame, as in playback, ending on the whole trajectory"""
+    positions = np.arange(samples_per_frame, n_samples + samples_per_frame, samples_per_frame)
+    return np.minimum(positions, n_samples)
+
+
+def render_frames(job):
+    """Draw a contiguous range of frames offscreen and write each one as a PNG file.
+
+    The trajectory is opened read-only from the store named in the job, so
+    every worker maps the same file instead of receiving a pickled copy.
+    """
+    from PIL import Image
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from attractor_animation import animation_axes, AttractorAnimator
+
+    solution, _ = open_trajectory(job['trajectory'])
+    fig = Figure(figsize=job['size'], dpi=job['dpi'])
+    canvas = FigureCanvasAgg(fig)
+    ax = animation_axes(fig, job['low'], job['high'])
+    animator = AttractorAnimator(fig, ax, solution)
+
+    # Static axes drawn once; every frame blits the animated artists over them
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+    for index, position in zip(job['indices'], job['positions']):
+        canvas.restore_region(background)
+        for artist in animator.draw(position):
+            ax.draw_artist(artist)
+        image = Image.fromarray(np.asarray(canvas.buffer_rgba())).convert('RGB')
+        if job['format'] == 'gif':
+            # Palette reduction is the slow part of GIF writing; done here it runs in parallel
+            # Pillow < 9.1 has the method constants on Image itself
+            image = image.quantize(colors=256, method=getattr(Image, 'Quantize', Image).FASTOCTREE)
+        image.save(job['pattern'].format(index), compress_level=job['compress_level'])
+    return len(job['indices'])
+
+
+def _stored_frames(paths):
+    """Rendered frames loaded as a list; Pillow's APNG writer walks ``append_images`` twice"""
+    from PIL import Image
+
+    frames = []
+    for path in paths:
+        with Image.open(path) as image:
+            image.load()
+        frames.append(image)
+    return frames
+
+
+def _trajectory_store(solution, scratch):
+    """Path of a .npy store holding ``solution``, written to ``scratch`` unless it is already memory-mapped"""
+    data = solution.data if isinstance(solution, CompactTrajectory) else solution
+    if isinstance(data, np.memmap) and data.filename:
+        return data.filename
+    return save_trajectory(os.path.join(scratch, 'trajectory.npy'), solution)
+
+
+def export_animation(solution, path, samples_per_frame=20, fps=30, size=(8.0, 6.0), dpi=100, workers=None,
+                     progress=None, check_cancelled=None):
+    """Render the attractor animation of ``solution`` to ``path`` without a screen.
+
+    Frames are split into contiguous ranges rendered by ``workers`` processes
+    (default: one per core; a single worker renders in this process), then
+    joined with Pillow into a GIF or APNG played at ``fps``. A ``.png`` path
+    instead gets one ``<name>_<frame>.png`` file per frame. Returns a stats
+    dict with the frame count, worker count and wall time.
+    """
+    start_time = time.perf_counter()
+    output_format = export_format(path)
+    positions = frame_positions(len(solution), samples_per_frame)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(positions)))
+    low, high = trajectory_bounds(solution)
+
+    scratch = tempfile.mkdtemp(prefix='lorenz-export-')
+    try:
+        if output_format == 'png':
+            pattern = os.path.splitext(path)[0] + '_{:05d}.png'
+        else:
+            pattern = os.path.join(scratch, 'frame_{:05d}.png')
+        base_job = {
+            'trajectory': _trajectory_store(solution, scratch),
+            'low': low.tolist(),
+            'high': high.tolist(),
+            'size': size,
+            'dpi': dpi,
+            'format': output_format,
+            'pattern': pattern,
+            # Intermediate frames favour speed over size
+            'compress_level': 6 if output_format == 'png' else 1,
+        }
+        # A few ranges per worker keeps the pool busy when frame costs differ
+        shards = np.array_split(np.arange(len(positions)), min(len(positions), workers * 4))
+        jobs = [dict(base_job, indices=shard.tolist(), positions=positions[shard].tolist()) for shard in shards]
+
+        rendered = 0
+        if workers == 1:
+            for job in jobs:
+                if check_cancelled is not None:
+                    check_cancelled()
+                rendered += render_frames(job)
+                if progress is not None:
+                    progress(0.9 * rendered / len(positions))
+        else:
+            # Spawned workers need NumPy, matplotlib's Agg backend and Pillow; main.py skips its Tk imports when re-run in them
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+                pending = {executor.submit(render_frames, job) for job in jobs}
+                try:
+                    while pending:
+                        done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                        rendered += sum(future.result() for future in done)
+                        if check_cancelled is not None:
+                            check_cancelled()
+                        if progress is not None:
+                            progress(0.9 * rendered / len(positions))
+                except BaseException:
+                    # Executor.shutdown(cancel_futures=True) needs Python 3.9
+                    for future in pending:
+                        future.cancel()
+                    executor.shutdown(wait=False)
+                    raise
+
+        if output_format != 'png':
+            frame_paths = [pattern.format(index) for index in range(len(positions))]
+            first, *frames = _stored_frames(frame_paths)
+            first.save(path, format='GIF' if output_format == 'gif' else 'PNG', save_all=True, append_images=frames,
+                       duration=1000.0 / fps, loop=0)
+        if progress is not None:
+            progress(1.0)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    return {
+        'frames': len(positions),
+        'workers': workers,
+        'format': output_format,
+        'wall_time': time.perf_counter() - start_time,
+    }
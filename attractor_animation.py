@@ -0,0 +1,202 @@
+"""
+Lorenz Attractor Visualizer - Animation
+Blitted, wall-clock driven animators; Tk-free so offscreen export workers can draw the same frames
+"""
+
+import time
+
+import numpy as np
+import matplotlib
+
+from perf_trace import perf
+
+# Animation Axes
+def animation_axes(fig, low, high, title='Lorenz Attractor - Animated'):
+    """Fresh 3-D axes on ``fig`` with fixed limits, styled like the static plot.
+
+    The limits never change while playing, so the axes can serve as the blit background.
+    """
+    fig.clear()
+    ax = fig.add_subplot(111, projection='3d')
+    ax.set_xlim([low[0], high[0]])
+    ax.set_ylim([low[1], high[1]])
+    ax.set_zlim([low[2], high[2]])
+    ax.set_title(title, fontsize=14, fontweight='bold', color='#2c3e50')
+    ax.set_xlabel('X', fontsize=12, color='#34495e')
+    ax.set_ylabel('Y', fontsize=12, color='#34495e')
+    ax.set_zlabel('Z', fontsize=12, color='#34495e')
+    return ax
+
+# Animation Engine
+class WallClockAnimator:
+    """Blitted animation that advances by elapsed time rather than by frame count.
+
+    The static axes are drawn once and reused as the blit background. Each
+    frame jumps to the sample implied by the elapsed time, so frames that
+    render late are dropped instead of slowing playback. Subclasses fill in
+    ``_artists`` and ``draw(position)``.
+    """
+    def __init__(self, fig, n_samples, samples_per_second, target_fps=30, repeat=True, on_fps=None):
+        self.fig = fig
+        self.n_samples = n_samples
+        self.samples_per_second = samples_per_second
+        self.target_fps = target_fps
+        self.repeat = repeat
+        self.on_fps = on_fps
+        self.animation = None
+        self.position = 0
+        self.measured_fps = 0.0
+        self._artists = ()
+
+    def start(self):
+        import matplotlib.animation as animation
+        
+        self.reset_clock()
+        self.animation = animation.FuncAnimation(self.fig, self.update, init_func=self.init, frames=None,
+                                                 interval=1000.0 / self.target_fps, blit=True,
+                                                 cache_frame_data=False)
+        return self.animation
+
+    def stop(self):
+        if self.animation is not None:
+            self.animation.event_source.stop()
+            self.animation = None
+
+    def reset_clock(self, position=0):
+        """Restart playback timing so the next frame shows ``position``"""
+        now = time.perf_counter()
+        self._start_time = now - position / self.samples_per_second
+        self._fps_window_start = now
+        self._fps_frames = 0
+
+    def init(self):
+        return self._artists
+
+    def update(self, frame=None):
+        with perf.stage('animation frame'):
+            return self._update()
+
+    def _update(self):
+        now = time.perf_counter()
+        n = self.n_samples
+        position = int((now - self._start_time) * self.samples_per_second) + 1
+        if position > n:
+            if self.repeat:
+                self._start_time = now
+                position = 1
+            else:
+                position = n
+                self.stop()
+        self.position = position
+        artists = self.draw(position)
+        self._measure_fps(now)
+        return artists
+
+    def draw(self, position):
+        """Update the animated artists to show the first ``position`` samples"""
+        raise NotImplementedError
+
+    def _measure_fps(self, now):
+        self._fps_frames += 1
+        elapsed = now - self._fps_window_start
+        if elapsed >= 1.0:
+            self.measured_fps = self._fps_frames / elapsed
+            self._fps_frames = 0
+            self._fps_window_start = now
+            if self.on_fps is not None:
+                self.on_fps(self.measured_fps)
+
+# Attractor Animation
+class AttractorAnimator(WallClockAnimator):
+    """Blitted, wall-clock driven animation of a 3-D trajectory.
+
+    Only a fixed trailing window plus a decimated history is drawn, so
+    per-frame cost does not grow with the frame index.
+    """
+    def __init__(self, fig, ax, solution, samples_per_frame=20, target_fps=30, trail_length=1500,
+                 max_history_points=3000, repeat=True, on_fps=None):
+        super().__init__(fig, len(solution), samples_per_frame * target_fps, target_fps, repeat, on_fps)
+        self.ax = ax
+        self.solution = solution
+        self.trail_length = trail_length
+        self.max_history_points = max_history_points
+
+        self.history_line, = ax.plot([], [], [], color='#e74c3c', linewidth=1, alpha=0.35, animated=True)
+        self.trail_line, = ax.plot([], [], [], color='#e74c3c', linewidth=2, alpha=0.9, animated=True)
+        self.head, = ax.plot([], [], [], 'o', color='#c0392b', markersize=5, animated=True)
+        self._artists = (self.history_line, self.trail_line, self.head)
+
+    def init(self):
+        for artist in self._artists:
+            artist.set_data_3d([], [], [])
+        return self._artists
+
+    def draw(self, position):
+        # Fixed-length trailing window
+        trail = np.asarray(self.solution[max(0, position - self.trail_length):position])
+        self.trail_line.set_data_3d(trail[:, 0], trail[:, 1], trail[:, 2])
+        self.head.set_data_3d(trail[-1:, 0], trail[-1:, 1], trail[-1:, 2])
+
+        # Older samples with a power-of-two stride so the history stays bounded
+        history_end = max(0, position - self.trail_length + 1)
+        stride = 1
+        while history_end // stride > self.max_history_points:
+            stride *= 2
+        history = np.asarray(self.solution[:history_end:stride])
+        if len(history):
+            self.history_line.set_data_3d(history[:, 0], history[:, 1], history[:, 2])
+        else:
+            self.history_line.set_data_3d([], [], [])
+        return self._artists
+
+# Ensemble Divergence Animation
+class EnsembleAnimator(WallClockAnimator):
+    """Blitted animation of an ensemble of trajectories and their spread.
+
+    The members' current states are one scatter, colored by member, and
+    their short tails are one polyline with NaN breaks between members. Both
+    are refilled from a single (tail, N, 3) slice each frame, so frame cost
+    grows with the number of drawn points and needs no per-member Python
+    work. A second, 2-D axes traces the ensemble spread up to the current time.
+    """
+    def __init__(self, fig, ax, spread_ax, trajectory, t, spread, samples_per_second=30.0, target_fps=30,
+                 tail_length=6, repeat=True, on_fps=None):
+        super().__init__(fig, len(trajectory), samples_per_second, target_fps, repeat, on_fps)
+        self.ax = ax
+        self.spread_ax = spread_ax
+        self.trajectory = trajectory
+        self.t = t
+        self.spread = spread
+        self.tail_length = tail_length
+        # One row of tail points per member; the extra NaN point breaks the polyline
+        self._tail_points = np.full((trajectory.shape[1], tail_length + 1, 3), np.nan)
+
+        colors = matplotlib.colormaps['plasma'](np.linspace(0.0, 0.9, trajectory.shape[1]))
+        start = trajectory[0]
+        self.tails, = ax.plot([], [], [], color='#7f8c8d', linewidth=0.8, alpha=0.5, animated=True)
+        self.heads = ax.scatter(start[:, 0], start[:, 1], start[:, 2], c=colors, s=4, linewidths=0,
+                                depthshade=False, animated=True)
+        self.spread_line, = spread_ax.plot([], [], color='#8e44ad', linewidth=1.5, animated=True)
+        self._artists = (self.tails, self.heads, self.spread_line)
+
+    def init(self):
+        self.tails.set_data_3d([], [], [])
+        self.spread_line.set_data([], [])
+        return self._artists
+
+    def draw(self, position):
+        window = self.trajectory[max(0, position - self.tail_length):position]
+        tail = self._tail_points
+        tail[:, :len(window)] = window.swapaxes(0, 1)
+        tail[:, len(window):] = np.nan
+        points = tail.reshape(-1, 3)
+        self.tails.set_data_3d(points[:, 0], points[:, 1], points[:, 2])
+
+        head = window[-1]
+        self.heads.set_offsets(head[:, :2])
+        self.heads.set_3d_properties(head[:, 2], 'z')
+        # Blitting bypasses Axes3D.draw, which is where collections are normally projected
+        self.heads.do_3d_projection()
+
+        self.spread_line.set_data(self.t[:position], self.spread[:position])
+        return self._artists
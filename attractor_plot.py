@@ -0,0 +1,175 @@
+"""
+Lorenz Attractor Visualizer - Static Plots
+Level-of-detail 3-D trajectory plot and density view; Tk-free so they draw on any canvas, including offscreen Agg
+"""
+
+import numpy as np
+
+from density_render import bin_density, shade_density
+
+# Level-of-Detail Decimation
+def decimate_polyline(screen_points, max_points, sharp_turn=np.radians(30), max_cell=4.0, run_length=256):
+    """Indices of a screen-space polyline worth drawing.
+
+    A point is kept when it leaves the grid cell of its predecessor, with the
+    cell size grown from one pixel (up to ``max_cell``) until at most
+    ``max_points`` remain, or when the path turns by more than ``sharp_turn``
+    there so corners survive. A path too long for the budget even at the
+    coarsest cell (many passes over a saturated attractor) keeps evenly spaced
+    runs of ``run_length`` points; ``-1`` entries mark the breaks between runs.
+    """
+    n = len(screen_points)
+    if n <= max(max_points, 2):
+        return np.arange(n)
+
+    steps = np.diff(screen_points, axis=0)
+    cross = steps[:-1, 0] * steps[1:, 1] - steps[:-1, 1] * steps[1:, 0]
+    dot = np.einsum('ij,ij->i', steps[:-1], steps[1:])
+    sharp = np.zeros(n, dtype=bool)
+    sharp[1:-1] = np.abs(np.arctan2(cross, dot)) > sharp_turn
+    if sharp.sum() > max_points // 4:
+        sharp[:] = False
+    sharp[0] = sharp[-1] = True
+
+    cell = 1.0
+    moved = np.empty(n, dtype=bool)
+    moved[0] = True
+    while True:
+        cells = np.floor(screen_points / cell).astype(np.int64)
+        np.any(cells[1:] != cells[:-1], axis=1, out=moved[1:])
+        keep = np.flatnonzero(moved | sharp)
+        if len(keep) <= max_points:
+            return keep
+        if cell >= max_cell:
+            break
+        # A curve's cell crossings scale roughly inversely with the cell size
+        cell = min(max_cell, cell * max(1.1, 1.05 * len(keep) / max_points))
+
+    run_length = max(2, min(run_length, max_points // 2))
+    n_runs = len(keep) // run_length
+    chosen = np.linspace(0, n_runs - 1, max(1, max_points // (run_length + 1))).astype(np.intp)
+    runs = keep[:n_runs * run_length].reshape(n_runs, run_length)[np.unique(chosen)]
+    breaks = np.full((len(runs), 1), -1, dtype=runs.dtype)
+    return np.hstack([runs, breaks]).ravel()[:-1]
+
+class TrajectoryLOD:
+    """Screen-resolution level of detail for a long trajectory on 3-D axes.
+
+    The line only ever holds a pixel- and curvature-aware subset of the data;
+    after every rotate, zoom, scroll or resize the subset is recomputed from
+    the full-resolution trajectory (pre-strided to ``max_candidates`` so the
+    work stays bounded for very long or memory-mapped inputs).
+    """
+    def __init__(self, ax, solution, line, points_per_pixel=8.0, max_candidates=500000):
+        self.ax = ax
+        self.line = line
+        self.points_per_pixel = points_per_pixel
+        self.max_candidates = max_candidates
+        self.set_solution(solution)
+        self.visible_points = 0
+        self._timer = None
+        canvas = ax.figure.canvas
+        self._connections = [canvas.mpl_connect(event, self._schedule_update)
+                             for event in ('button_release_event', 'scroll_event', 'resize_event')]
+
+    def set_solution(self, solution):
+        """Switch to another trajectory; call ``update`` to redraw"""
+        stride = max(1, int(np.ceil(len(solution) / self.max_candidates)))
+        self.candidates = np.asarray(solution[::stride], dtype=float)
+
+    def disconnect(self):
+        canvas = self.ax.figure.canvas
+        for connection in self._connections:
+            canvas.mpl_disconnect(connection)
+        self._connections = []
+        if self._timer is not None:
+            self._timer.stop()
+
+    def update(self, redraw=True):
+        """Pick the subset for the current view and push it to the line"""
+        from mpl_toolkits.mplot3d import proj3d
+        points = self.candidates
+        xs, ys, _ = proj3d.proj_transform(points[:, 0], points[:, 1], points[:, 2], self.ax.get_proj())
+        screen = self.ax.transData.transform(np.column_stack([xs, ys]))
+
+        bbox = self.ax.bbox
+        max_points = max(2, int(self.points_per_pixel * (bbox.width + bbox.height)))
+        indices = decimate_polyline(screen, max_points)
+        selected = points[indices]
+        selected[indices < 0] = np.nan
+        self.line.set_data_3d(selected[:, 0], selected[:, 1], selected[:, 2])
+        self.visible_points = int(np.count_nonzero(indices >= 0))
+        if redraw:
+            self.ax.figure.canvas.draw_idle()
+
+    def _schedule_update(self, event):
+        # The figure was cleared for another view; stop listening
+        if self.ax not in self.ax.figure.axes:
+            self.disconnect()
+            return
+        # Coalesce bursts of events (e.g. scrolling) into one re-decimation
+        if self._timer is None:
+            self._timer = self.ax.figure.canvas.new_timer(interval=60)
+            self._timer.single_shot = True
+            self._timer.add_callback(self.update)
+        self._timer.stop()
+        self._timer.start()
+
+# Static 3-D Attractor Plot
+def draw_attractor(fig, solution):
+    """Replace the contents of ``fig`` with a styled 3-D plot of ``solution``.
+
+    The trajectory is drawn through a ``TrajectoryLOD``; returns ``(ax, lod)``.
+    Works on any canvas, including an offscreen Agg one.
+    """
+    # Clear previous plot
+    fig.clear()
+    
+    # Create 3D subplot
+    ax = fig.add_subplot(111, projection='3d')
+    
+    line, = ax.plot([], [], [], color='#e74c3c', linewidth=1, alpha=0.8)
+    lod = TrajectoryLOD(ax, solution, line)
+    candidates = lod.candidates
+    ax.auto_scale_xyz(candidates[:, 0], candidates[:, 1], candidates[:, 2])
+    lod.update(redraw=False)
+    
+    # Styling
+    ax.set_title('Lorenz Attractor - 3D Trajectory', fontsize=14, fontweight='bold', color='#2c3e50')
+    ax.set_xlabel('X', fontsize=12, color='#34495e')
+    ax.set_ylabel('Y', fontsize=12, color='#34495e')
+    ax.set_zlabel('Z', fontsize=12, color='#34495e')
+    
+    # Set background color
+    ax.xaxis.pane.fill = False
+    ax.yaxis.pane.fill = False
+    ax.zaxis.pane.fill = False
+    return ax, lod
+
+def draw_density(fig, solution, projection='XY', shading='eq-hist', elevation=30.0, azimuth=-60.0, resolution=800,
+                 accumulator=None):
+    """Replace the contents of ``fig`` with a density image of ``solution``.
+
+    The trajectory is binned once into a ``resolution`` x ``resolution``
+    image, so redrawing it costs the same however many samples it holds.
+    '3D' uses an orthographic camera at ``elevation`` and ``azimuth``. An
+    ``accumulator`` already binned for this projection and camera skips the
+    binning pass, so switching the shading only re-shades the counts.
+    Returns the axes.
+    """
+    if accumulator is None:
+        accumulator = bin_density(solution, projection, resolution, resolution, elevation, azimuth)
+    image = shade_density(accumulator.counts, shading)
+    
+    fig.clear()
+    ax = fig.add_subplot(111)
+    ax.imshow(image, origin='lower', extent=accumulator.extent, cmap='inferno', interpolation='nearest',
+              aspect='equal' if projection == '3D' else 'auto')
+    ax.set_title(f'Lorenz Attractor - Density ({projection}, {shading})', fontsize=14, fontweight='bold', color='#2c3e50')
+    if projection == '3D':
+        ax.set_xticks([])
+        ax.set_yticks([])
+    else:
+        ax.set_xlabel(projection[0], fontsize=12, color='#34495e')
+        ax.set_ylabel(projection[1], fontsize=12, color='#34495e')
+    return ax
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Lorenz Attractor Visualizer - Headless Batch Sweeps
+Runs a parameter sweep across a process pool without importing Tk or matplotlib
+
+Example specification (JSON):
+    {
+        "sigma": {"start": 8.0, "stop": 12.0, "num": 5},
+        "rho": [24.0, 28.0, 32.0],
+        "beta": 2.6667,
+        "seeds": {"count": 4},
+        "time_steps": 100000,
+        "dt": 0.01,
+        "solver": "odeint"
+    }
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from chaos_core import generate_initial_conditions_from_logistic, iter_lorenz_chunks, TrajectoryStats, LORENZ_SOLVERS
+from trajectory_store import write_trajectory_chunks
+
+
+def expand_values(value):
+    """Turn a scalar, a list or a {"start", "stop", "num"} range into a list"""
+    if isinstance(value, dict):
+        return np.linspace(value['start'], value['stop'], int(value['num'])).tolist()
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def expand_seeds(value):
+    """Seeds are logistic map seeds in (0, 1); {"count": n} spreads n of them evenly"""
+    if isinstance(value, dict) and 'count' in value:
+        count = int(value['count'])
+        start = value.get('start', 0.05)
+        stop = value.get('stop', 0.95)
+        seeds = np.linspace(start, stop, count).tolist()
+    else:
+        seeds = expand_values(value)
+    if not all(0 < seed < 1 for seed in seeds):
+        raise ValueError("Seeds must lie strictly between 0 and 1")
+    return seeds
+
+
+def expand_sweep(spec):
+    """List of run descriptions for every combination in the specification"""
+    # Each run is a single trajectory, where odeint is far faster than the NumPy ensemble rk4
+    solver = spec.get('solver', 'odeint')
+    if solver not in LORENZ_SOLVERS:
+        raise ValueError(f"Unknown solver '{solver}', expected one of {', '.join(LORENZ_SOLVERS)}")
+
+    grid = itertools.product(
+        expand_values(spec.get('sigma', 10.0)),
+        expand_values(spec.get('rho', 28.0)),
+        expand_values(spec.get('beta', 8.0 / 3.0)),
+        expand_seeds(spec.get('seeds', [0.1])),
+        expand_values(spec.get('time_steps', 10000)),
+    )
+    runs = []
+    for index, (sigma, rho, beta, seed, time_steps) in enumerate(grid):
+        runs.append({
+            'run': index,
+            'sigma': float(sigma),
+            'rho': float(rho),
+            'beta': float(beta),
+            'seed': float(seed),
+            'time_steps': int(time_steps),
+            'dt': float(spec.get('dt', 0.01)),
+            'solver': solver,
+            'logistic_iterations': int(spec.get('logistic_iterations', 100)),
+            'chunk_size': int(spec.get('chunk_size', 65536)),
+        })
+    return runs
+
+
+def run_one(run, trajectory_dir=None):
+    """Integrate a single run in constant memory and return its statistics"""
+    start = time.perf_counter()
+    initial_state = generate_initial_conditions_from_logistic(run['seed'], r=3.9, iterations=run['logistic_iterations'])
+    initial_state = [float(value) for value in initial_state]
+    chunks = iter_lorenz_chunks(initial_state, run['dt'], run['time_steps'] - 1, run['sigma'], run['rho'], run['beta'],
+                                solver=run['solver'], chunk_size=run['chunk_size'])
+
+    stats = TrajectoryStats()
+    if trajectory_dir is not None:
+        # Tee the chunks into a trajectory store while reducing them
+        def recorded(chunks):
+            for t, states in chunks:
+                stats.update(t, states)
+                yield t, states
+        metadata = dict(run, system='lorenz', initial_state=initial_state, t0=0.0)
+        path = os.path.join(trajectory_dir, f"run_{run['run']:05d}.npy")
+        write_trajectory_chunks(path, recorded(chunks), run['time_steps'], metadata)
+    else:
+        for t, states in chunks:
+            stats.update(t, states)
+
+    result = dict(run, initial_state=initial_state, wall_time=time.perf_counter() - start)
+    result.update(stats.as_dict())
+    return result
+
+
+def summarize(results):
+    """Aggregate statistics over all runs of a sweep"""
+    std = np.array([result['std'] for result in results])
+    extent = np.array([np.subtract(result['max'], result['min']) for result in results])
+    wall_time = np.array([result['wall_time'] for result in results])
+    return {
+        'runs': len(results),
+        'total_samples': int(sum(result['count'] for result in results)),
+        'total_wall_time': float(wall_time.sum()),
+        'mean_wall_time': float(wall_time.mean()),
+        'std_mean': std.mean(axis=0).tolist(),
+        'std_min': std.min(axis=0).tolist(),
+        'std_max': std.max(axis=0).tolist(),
+        'extent_mean': extent.mean(axis=0).tolist(),
+        'extent_min': extent.min(axis=0).tolist(),
+        'extent_max': extent.max(axis=0).tolist(),
+    }
+
+
+def write_results(out_dir, results, summary):
+    """Per-run JSON lines and CSV plus a summary JSON"""
+    with open(os.path.join(out_dir, 'runs.jsonl'), 'w') as f:
+        for result in results:
+            f.write(json.dumps(result) + '\n')
+
+    columns = ['run', 'sigma', 'rho', 'beta', 'seed', 'time_steps', 'dt', 'solver', 'wall_time']
+    with open(os.path.join(out_dir, 'runs.csv'), 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns + ['final_x', 'final_y', 'final_z', 'std_x', 'std_y', 'std_z'])
+        for result in results:
+            writer.writerow([result[column] for column in columns] + result['final_state'] + result['std'])
+
+    with open(os.path.join(out_dir, 'summary.json'), 'w') as f:
+        json.dump(summary, f, indent=2)
+
+
+def run_sweep(spec, out_dir, workers=None, save_trajectories=False, progress=print):
+    """Run every combination of the sweep on a process pool and write the results"""
+    os.makedirs(out_dir, exist_ok=True)
+    runs = expand_sweep(spec)
+    trajectory_dir = None
+    if save_trajectories:
+        trajectory_dir = os.path.join(out_dir, 'trajectories')
+        os.makedirs(trajectory_dir, exist_ok=True)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_one, run, trajectory_dir) for run in runs]
+        for done, future in enumerate(futures, start=1):
+            results.append(future.result())
+            if progress is not None:
+                progress(f"[{done}/{len(runs)}] run {results[-1]['run']} finished in {results[-1]['wall_time']:.2f} s")
+
+    summary = summarize(results)
+    write_results(out_dir, results, summary)
+    return results, summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a headless Lorenz parameter sweep")
+    parser.add_argument('spec', help="JSON sweep specification")
+    parser.add_argument('--out', default='sweep_results', help="output directory")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--save-trajectories', action='store_true',
+                        help="also store every trajectory as a memory-mappable .npy file")
+    args = parser.parse_args(argv)
+
+    with open(args.spec) as f:
+        spec = json.load(f)
+
+    start = time.perf_counter()
+    results, summary = run_sweep(spec, args.out, workers=args.workers, save_trajectories=args.save_trajectories)
+    print(f"✓ {summary['runs']} runs, {summary['total_samples']} samples in {time.perf_counter() - start:.2f} s")
+    print(f"✓ Results written to {os.path.abspath(args.out)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
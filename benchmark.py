@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Lorenz Attractor Visualizer - Performance Benchmarks
+Compares the ensemble RK4 integrator with the per-trajectory odeint path
+and measures the throughput of the bulk chaotic number stream
+
+The ``suite`` command times the numeric core and the rendering hot paths and
+writes JSON; ``compare`` reports regressions between two such files:
+
+    python benchmark.py suite --out baseline.json
+    python benchmark.py suite --out current.json
+    python benchmark.py compare baseline.json current.json --threshold 0.1
+"""
+
+import sys
+import json
+import time
+import platform
+import argparse
+
+import numpy as np
+
+import chaos_core
+
+
+def bench_lorenz_ensemble(sizes=(1, 100, 10000), t_end=10.0, dt=0.01, odeint_sample=200):
+    """Measure trajectories per second for odeint and the ensemble integrator"""
+    n_steps = int(round(t_end / dt))
+    t = np.linspace(0, n_steps * dt, n_steps + 1)
+    rng = np.random.default_rng(0)
+    results = []
+    # scipy.integrate is imported on the first solve; keep that out of the timings
+    chaos_core.lorenz_solution([1.0, 1.0, 1.0], t[:2], cache=False)
+
+    for n in sizes:
+        initial_states = np.array([1.0, 1.0, 1.0]) + rng.normal(scale=1e-3, size=(n, 3))
+
+        # odeint solves one trajectory per call; time a sample of large ensembles
+        sample = min(n, odeint_sample)
+        start = time.perf_counter()
+        for state in initial_states[:sample]:
+            chaos_core.lorenz_solution(state, t, cache=False)
+        odeint_rate = sample / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        chaos_core.integrate_lorenz_ensemble(initial_states, dt, n_steps, stride=10)
+        ensemble_rate = n / (time.perf_counter() - start)
+
+        results.append({
+            'n': n,
+            'odeint_per_sec': odeint_rate,
+            'ensemble_per_sec': ensemble_rate,
+            'odeint_sampled': sample < n,
+        })
+    return results
+
+
+def bench_chaotic_stream(trajectories=(64, 1024, 8192), n_values=1000000, single_calls=3):
+    """Values per second of ChaoticStream next to generate_chaotic_numbers_and_3D_plot"""
+    # Three numbers per call after a full odeint solve
+    start = time.perf_counter()
+    for seed in np.linspace(0.1, 0.9, single_calls):
+        chaos_core.generate_chaotic_numbers_and_3D_plot(seed, 100)
+    single_rate = 3 * single_calls / (time.perf_counter() - start)
+
+    results = []
+    for n in trajectories:
+        start = time.perf_counter()
+        stream = chaos_core.ChaoticStream(seed=0.1, n_trajectories=n)
+        setup_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stream.values(n_values)
+        elapsed = time.perf_counter() - start
+        results.append({
+            'n_trajectories': n,
+            'values_per_sec': n_values / elapsed,
+            'setup_time': setup_time,
+            'speedup': n_values / elapsed / single_rate,
+        })
+    return single_rate, results
+
+
+# Problem sizes of the benchmark suite; --full covers the whole realistic range
+SUITE_SIZES = {
+    'quick': {
+        'logistic_iterations': [10 ** 2, 10 ** 4, 10 ** 6],
+        'sweep_iterations': [10 ** 3, 10 ** 4],
+        'lorenz_time_steps': [10 ** 3, 10 ** 4, 10 ** 5],
+        'render_time_steps': [10 ** 3, 10 ** 4, 10 ** 5],
+    },
+    'full': {
+        'logistic_iterations': [10 ** k for k in range(2, 8)],
+        'sweep_iterations': [10 ** k for k in range(3, 6)],
+        'lorenz_time_steps': [10 ** k for k in range(3, 8)],
+        'render_time_steps': [10 ** k for k in range(3, 8)],
+    },
+}
+
+
+def time_call(function, repeat=5, max_seconds=2.0):
+    """Best and median wall time of ``function()``; slow calls are repeated less"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+        if sum(times) > max_seconds:
+            break
+    return {'best': min(times), 'median': float(np.median(times)), 'runs': len(times)}
+
+
+def bench_logistic_map(iterations_list, repeat=5):
+    """``logistic_map`` for a single orbit of each length"""
+    return {f"logistic_map[iterations={n}]": time_call(lambda: chaos_core.logistic_map(0.1, 3.9, n), repeat)
+            for n in iterations_list}
+
+
+def bench_logistic_sweeps(iterations_list, repeat=5):
+    """Lyapunov and bifurcation r sweeps; orbits found on a cycle stop iterating"""
+    r_values = np.linspace(1.0, 4.0, 2000)
+    results = {}
+    for n in iterations_list:
+        def bifurcation():
+            accumulator = chaos_core.BifurcationAccumulator()
+            for _ in range(n // 100):
+                accumulator.step(100)
+
+        results[f"logistic_lyapunov[iterations={n}]"] = time_call(
+            lambda: chaos_core.logistic_lyapunov(r_values, iterations=n), repeat)
+        results[f"bifurcation[iterations={n}]"] = time_call(bifurcation, repeat)
+    return results
+
+
+def bench_lorenz_solution(time_steps_list, solvers=('odeint',), repeat=5):
+    """Uncached ``lorenz_solution`` on the GUI time grid"""
+    results = {}
+    for solver in solvers:
+        for n in time_steps_list:
+            t = np.arange(n) * 0.01
+            results[f"lorenz_solution[solver={solver},time_steps={n}]"] = time_call(
+                lambda: chaos_core.lorenz_solution([1.0, 1.0, 1.0], t, solver=solver, cache=False), repeat)
+    return results
+
+
+def bench_rendering(time_steps_list, frames=100, repeat=5, figsize=(10, 8), dpi=100):
+    """Offscreen Agg cost of the static 3-D plot, an LOD re-decimation, the density view and an animation frame"""
+    # Drawn on an offscreen Agg canvas with the same Tk-free helpers the GUI uses
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from attractor_plot import draw_attractor, draw_density
+    from attractor_animation import AttractorAnimator
+
+    results = {}
+    for n in time_steps_list:
+        solution = chaos_core.lorenz_solution([1.0, 1.0, 1.0], np.arange(n) * 0.01, cache=False)
+        fig = Figure(figsize=figsize, dpi=dpi)
+        canvas = FigureCanvasAgg(fig)
+
+        def plot():
+            ax, lod = draw_attractor(fig, solution)
+            canvas.draw()
+            return ax, lod
+
+        results[f"plot_3d_graph[time_steps={n}]"] = time_call(plot, repeat)
+
+        # Density image: binning is linear in samples, redrawing the image is not
+        def plot_density():
+            draw_density(fig, solution, '3D')
+            canvas.draw()
+
+        results[f"density_render[time_steps={n}]"] = time_call(plot_density, repeat)
+        results[f"density_redraw[time_steps={n}]"] = time_call(canvas.draw, repeat)
+
+        ax, lod = plot()
+        results[f"lod_update[time_steps={n}]"] = time_call(lambda: lod.update(redraw=False), repeat)
+
+        # One blitted frame: restore the background, update the artists and draw them
+        animator = AttractorAnimator(fig, ax, solution)
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+        positions = np.linspace(1, len(solution), frames).astype(int)
+
+        def frame_loop():
+            for position in positions:
+                animator.reset_clock(position)
+                canvas.restore_region(background)
+                for artist in animator.update():
+                    ax.draw_artist(artist)
+                canvas.blit(fig.bbox)
+
+        timing = time_call(frame_loop, repeat)
+        results[f"animation_frame[time_steps={n}]"] = {key: value / frames if key != 'runs' else value
+                                                       for key, value in timing.items()}
+    return results
+
+
+def run_suite(preset='quick', solvers=('odeint',), repeat=5, rendering=True, progress=print):
+    """Run every suite benchmark and return a JSON-serializable report"""
+    import matplotlib
+
+    sizes = SUITE_SIZES[preset]
+    report = {
+        'meta': {
+            'preset': preset,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'matplotlib': matplotlib.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+        },
+        'results': {},
+    }
+    # Warm up lazy imports and caches outside the timings
+    chaos_core.lorenz_solution([1.0, 1.0, 1.0], np.arange(10) * 0.01, cache=False)
+
+    benches = [
+        lambda: bench_logistic_map(sizes['logistic_iterations'], repeat),
+        lambda: bench_logistic_sweeps(sizes['sweep_iterations'], repeat),
+        lambda: bench_lorenz_solution(sizes['lorenz_time_steps'], solvers, repeat),
+    ]
+    if rendering:
+        benches.append(lambda: bench_rendering(sizes['render_time_steps'], repeat=repeat))
+    for bench in benches:
+        for name, timing in bench().items():
+            report['results'][name] = timing
+            if progress is not None:
+                progress(f"{name:<55} {timing['best'] * 1000:>12.3f} ms")
+    return report
+
+
+def compare_reports(baseline, current, threshold=0.1):
+    """Relative change of every benchmark present in both reports.
+
+    Best times are compared; a benchmark regresses when it became slower by
+    more than ``threshold`` (0.1 = 10 %).
+    """
+    rows = []
+    for name, old in baseline['results'].items():
+        new = current['results'].get(name)
+        if new is None:
+            continue
+        change = new['best'] / old['best'] - 1.0
+        status = 'regression' if change > threshold else 'improvement' if change < -threshold else 'ok'
+        rows.append({'name': name, 'baseline': old['best'], 'current': new['best'], 'change': change, 'status': status})
+    return rows
+
+
+def suite_cli(args):
+    report = run_suite('full' if args.full else 'quick', solvers=args.solvers, repeat=args.repeat,
+                       rendering=not args.no_rendering)
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"✓ {len(report['results'])} benchmarks written to {args.out}")
+    return 0
+
+
+def compare_cli(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    rows = compare_reports(baseline, current, args.threshold)
+    print(f"{'benchmark':<55} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for row in rows:
+        marker = {'regression': '  ✗', 'improvement': '  ✓'}.get(row['status'], '')
+        print(f"{row['name']:<55} {row['baseline'] * 1000:>12.3f} {row['current'] * 1000:>12.3f} "
+              f"{row['change'] * 100:>+7.1f}%{marker}")
+    regressions = [row for row in rows if row['status'] == 'regression']
+    print(f"{len(regressions)} regression(s) above {args.threshold * 100:.0f}% out of {len(rows)} benchmarks")
+    return 1 if regressions else 0
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Lorenz integrators")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 100, 10000],
+                        help="ensemble sizes to benchmark")
+    parser.add_argument('--t-end', type=float, default=10.0, help="integration horizon")
+    parser.add_argument('--dt', type=float, default=0.01, help="integrator step size")
+    parser.add_argument('--stream-values', type=int, default=1000000,
+                        help="values drawn from the chaotic number stream per ensemble size")
+    parser.add_argument('--stream-trajectories', type=int, nargs='+', default=[64, 1024, 8192],
+                        help="parallel seeds of the chaotic number stream")
+    commands = parser.add_subparsers(dest='command')
+
+    suite = commands.add_parser('suite', help="time the numeric core and rendering hot paths and write JSON")
+    suite.add_argument('--out', default='benchmark_results.json', help="JSON report to write")
+    suite.add_argument('--full', action='store_true', help="sizes up to 10^7 iterations / time steps")
+    suite.add_argument('--solvers', nargs='+', default=['odeint'], choices=chaos_core.LORENZ_SOLVERS,
+                       help="lorenz_solution backends to time")
+    suite.add_argument('--repeat', type=int, default=5, help="runs per benchmark (best time is reported)")
+    suite.add_argument('--no-rendering', action='store_true', help="skip the matplotlib benchmarks")
+
+    compare = commands.add_parser('compare', help="report regressions between two suite reports")
+    compare.add_argument('baseline', help="earlier JSON report")
+    compare.add_argument('current', help="JSON report to check")
+    compare.add_argument('--threshold', type=float, default=0.1,
+                         help="relative slowdown counted as a regression (default 0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'suite':
+        return suite_cli(args)
+    if args.command == 'compare':
+        return compare_cli(args)
+
+    print(f"Lorenz trajectories per second (t = 0..{args.t_end}, dt = {args.dt})")
+    print(f"{'N':>8} {'odeint':>14} {'ensemble RK4':>14} {'speedup':>9}")
+    for row in bench_lorenz_ensemble(args.sizes, args.t_end, args.dt):
+        note = '*' if row['odeint_sampled'] else ''
+        speedup = row['ensemble_per_sec'] / row['odeint_per_sec']
+        print(f"{row['n']:>8} {row['odeint_per_sec']:>13.1f}{note or ' '} "
+              f"{row['ensemble_per_sec']:>14.1f} {speedup:>8.1f}x")
+    print("* odeint rate measured on a sample of the ensemble")
+
+    single_rate, rows = bench_chaotic_stream(args.stream_trajectories, args.stream_values)
+    print(f"\nChaotic numbers per second ({args.stream_values} values per run)")
+    print(f"generate_chaotic_numbers_and_3D_plot: {single_rate:.1f}")
+    print(f"{'seeds':>8} {'values/sec':>14} {'setup s':>9} {'speedup':>10}")
+    for row in rows:
+        print(f"{row['n_trajectories']:>8} {row['values_per_sec']:>14.0f} {row['setup_time']:>9.2f} {row['speedup']:>9.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
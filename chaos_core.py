@@ -0,0 +1,1401 @@
+"""
+Lorenz Attractor Visualizer - Numerical Core
+Logistic map and Lorenz system solvers, importable without Tk or matplotlib
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Logistic Map Formula
+def logistic_map(x0, r, iterations, periods=False):
+    """Calculate the logistic map; with ``periods``, also its detected cycle (see ``logistic_map_batch``)"""
+    if periods:
+        values, cycle = logistic_map_batch(x0, r, iterations, periods=True)
+        return values[0], {key: int(value[0]) for key, value in cycle.items()}
+    return logistic_map_batch(x0, r, iterations)[0]
+
+# Longest cycle looked for by period detection; covers the 2^k cascade up to 64 and most windows
+MAX_DETECTED_PERIOD = 64
+
+# Periodic Orbit Detection
+def _cycle_periods(ring, newest, tolerance):
+    """Smallest period of every orbit in a (2 * max_period, m) circular history, 0 where none.
+
+    ``ring`` is time-major and its row ``newest`` holds the latest iterate. An
+    orbit has period p when its newest value is within ``tolerance`` of the
+    value p steps earlier and so are the p values before it, i.e. one whole
+    cycle repeats. Only orbits passing the first, cheap test are confirmed.
+    """
+    depth, m = ring.shape
+    max_period = depth // 2
+    period = np.zeros(m, dtype=np.intp)
+    # Row by row with one scratch buffer; a (max_period, m) temporary is several times slower
+    newest_value = ring[newest]
+    closest = np.full(m, np.inf)
+    difference = np.empty(m)
+    for lag in range(1, max_period + 1):
+        np.subtract(ring[(newest - lag) % depth], newest_value, out=difference)
+        np.abs(difference, out=difference)
+        np.minimum(closest, difference, out=closest)
+    candidates = np.flatnonzero(closest < tolerance)
+    if candidates.size == 0:
+        return period
+
+    recent = ring[np.ix_((newest - np.arange(depth)) % depth, candidates)]
+    lags = (np.abs(recent[1:max_period + 1] - recent[0]) < tolerance).argmax(axis=0) + 1
+    for p in np.unique(lags):
+        group = np.flatnonzero(lags == p)
+        confirmed = (np.abs(recent[:p, group] - recent[p:2 * p, group]) < tolerance).all(axis=0)
+        period[candidates[group[confirmed]]] = p
+    return period
+
+def _extend_cycles(values, first_kept, period, converged_at, cycles):
+    """Fill the iterates after each orbit converged by repeating its last ``period`` values"""
+    end = first_kept + len(values)
+    converged = np.flatnonzero(period)
+    # Orbits converge only at check steps, so few (period, step) groups share one tiled block
+    groups = np.unique(np.stack([period[converged], converged_at[converged]]), axis=1)
+    for p, step in groups.T:
+        start = max(first_kept, step + 1)
+        if start >= end:
+            continue
+        columns = converged[(period[converged] == p) & (converged_at[converged] == step)]
+        # Iterate ``step + k`` repeats cycle point ``k - 1`` (mod p)
+        block = np.roll(cycles[columns, -p:], -((start - step - 1) % p), axis=1)
+        repeats = -(-(end - start) // p)
+        values[start - first_kept:, columns] = np.tile(block, repeats)[:, :end - start].T
+
+# Batched Logistic Map
+def logistic_map_batch(x0, r, iterations, tail=None, grid=False, periods=False, tolerance=1e-9,
+                       max_period=MAX_DETECTED_PERIOD):
+    """Iterate many logistic map orbits in lockstep.
+
+    ``x0`` and ``r`` may be scalars or arrays; they are broadcast against each
+    other, or combined as an ``r`` x ``x0`` grid when ``grid`` is True.
+    Returns an ``(n_orbits, iterations)`` array whose first column holds the
+    initial values, or only the last ``tail`` iterates of every orbit.
+
+    With ``periods``, each orbit is checked for a cycle of at most
+    ``max_period`` points repeating within ``tolerance``, at intervals that
+    grow with the iteration count so detection lags convergence by at most a
+    quarter. Converged orbits stop iterating and the rest of their output
+    repeats the cycle. Returns ``(values, cycle)`` where ``cycle['period']``
+    is the period of each orbit (0 if none was found) and
+    ``cycle['converged_at']`` the iteration it was detected at (-1 if none).
+    """
+    x0 = np.asarray(x0, dtype=float)
+    r = np.asarray(r, dtype=float)
+    if grid:
+        r, x0 = np.meshgrid(r.ravel(), x0.ravel(), indexing='ij')
+    x0, r = np.broadcast_arrays(x0, r)
+    x = x0.ravel().copy()
+    r = r.ravel().copy()
+
+    keep = iterations if tail is None else min(tail, iterations)
+    first_kept = iterations - keep
+    # Time-major buffer so every step writes one contiguous row
+    values = np.empty((keep, x.size))
+
+    if periods:
+        depth = 2 * max_period
+        period = np.zeros(x.size, dtype=np.intp)
+        converged_at = np.full(x.size, -1, dtype=np.intp)
+        cycles = np.zeros((x.size, max_period))
+        if first_kept == 0:
+            values[0] = x
+        # Checks thin out geometrically and only the ``depth`` iterates before each one are kept
+        next_check = depth - 1
+
+        if x.size == 1:
+            xi, ri = float(x[0]), float(r[0])
+            row = values[:, 0]
+            recent = [xi]
+            for i in range(1, iterations):
+                xi = ri * xi * (1 - xi)  # Logistic map equation
+                if i >= first_kept:
+                    row[i - first_kept] = xi
+                if i > next_check - depth:
+                    recent.append(xi)
+                if i == next_check:
+                    next_check += max(depth, next_check // 4)
+                    # Cheap scalar test first: no earlier value within tolerance means no cycle yet
+                    if any(abs(xi - value) < tolerance for value in recent[-max_period - 1:-1]):
+                        history = np.array(recent)
+                        found = _cycle_periods(history[:, None], depth - 1, tolerance)[0]
+                        if found:
+                            period[0], converged_at[0], cycles[0] = found, i, history[-max_period:]
+                            break
+                    recent = []
+        else:
+            # Ring of the last iterates of the orbits still running; converged ones are dropped
+            active = np.arange(x.size)
+            ring = np.empty((depth, x.size))
+            ring[0] = x
+            scratch = np.empty_like(x)
+            for i in range(1, iterations):
+                np.multiply(r, x, out=scratch)
+                np.subtract(1.0, x, out=x)
+                np.multiply(scratch, x, out=x)
+                if i >= first_kept:
+                    if active.size == values.shape[1]:
+                        values[i - first_kept] = x
+                    else:
+                        values[i - first_kept, active] = x
+                if i > next_check - depth:
+                    ring[i % depth] = x
+                if i == next_check:
+                    next_check += max(depth, next_check // 4)
+                    found = _cycle_periods(ring, i % depth, tolerance)
+                    new = (found > 0) & (period[active] == 0)
+                    if new.any():
+                        columns = np.flatnonzero(new)
+                        period[active[columns]] = found[columns]
+                        converged_at[active[columns]] = i
+                        last_rows = np.arange(i + 1 - max_period, i + 1) % depth
+                        cycles[active[columns]] = ring[np.ix_(last_rows, columns)].T
+                    running = period[active] == 0
+                    # Dropping orbits copies the whole ring, so wait until it sheds a quarter of the work;
+                    # converged orbits left running just keep repeating their cycle
+                    if 4 * np.count_nonzero(running) <= 3 * active.size:
+                        active, x, r = active[running], x[running], r[running]
+                        # compress keeps the ring row-major, so per-step row writes stay contiguous
+                        ring = ring.compress(running, axis=1)
+                        scratch = np.empty_like(x)
+                        if active.size == 0:
+                            break
+
+        _extend_cycles(values, first_kept, period, converged_at, cycles)
+        return values.T, {'period': period, 'converged_at': converged_at}
+
+    if x.size == 1:
+        # A single orbit is faster with plain floats than with 1-element arrays
+        xi, ri = float(x[0]), float(r[0])
+        row = values[:, 0]
+        if first_kept == 0:
+            row[0] = xi
+        for i in range(1, iterations):
+            xi = ri * xi * (1 - xi)  # Logistic map equation
+            if i >= first_kept:
+                row[i - first_kept] = xi
+        return values.T
+
+    scratch = np.empty_like(x)
+    if first_kept == 0:
+        values[0] = x
+    for i in range(1, iterations):
+        # x = r * x * (1 - x), computed in place
+        np.multiply(r, x, out=scratch)
+        np.subtract(1.0, x, out=x)
+        np.multiply(scratch, x, out=x)
+        if i >= first_kept:
+            values[i - first_kept] = x
+    return values.T
+
+# Bifurcation Diagram Density
+class BifurcationAccumulator:
+    """Accumulate post-transient logistic orbits into a 2-D density image.
+
+    One orbit is followed per image column, so memory is bounded by the image
+    resolution and the chunk size passed to ``step``, never by the total
+    number of iterations. Columns whose orbit has settled on a cycle stop
+    iterating: every later step adds one visit spread over the cycle points,
+    and ``periods`` holds the detected period of each column (0 if none).
+    """
+    def __init__(self, r_min=2.5, r_max=4.0, width=1200, height=800, x0=0.5, transient=500, tolerance=1e-9):
+        self.r_values = np.linspace(r_min, r_max, width)
+        self.width = width
+        self.height = height
+        self.transient = transient
+        self.tolerance = tolerance
+        self.x = np.full(width, x0, dtype=float)
+        self.image = np.zeros((height, width))
+        self.periods = np.zeros(width, dtype=np.intp)
+        self.iterations_done = 0
+        self.transient_done = False
+        self._columns = np.arange(width)
+        # Sparse visits per iteration of the settled columns, and the recent history of the others
+        self._cycle_index = np.zeros(0, dtype=np.intp)
+        self._cycle_weight = np.zeros(0)
+        self._running = self._columns
+        self._history = None
+
+    def _settle(self, columns, orbits, periods):
+        """Move settled columns from iteration to their cycle's share of every later step"""
+        width = orbits.shape[1]
+        weights = (np.arange(width) >= width - periods[:, None]) / periods[:, None]
+        rows = np.clip((orbits * self.height).astype(np.intp), 0, self.height - 1)
+        index, inverse = np.unique(np.concatenate([self._cycle_index, (rows * self.width + columns[:, None]).ravel()]),
+                                   return_inverse=True)
+        self._cycle_weight = np.bincount(inverse, np.concatenate([self._cycle_weight, weights.ravel()]))
+        self._cycle_index = index
+        self.periods[columns] = periods
+
+    def step(self, iterations):
+        """Advance every orbit and add the visited states to the image"""
+        depth = 2 * MAX_DETECTED_PERIOD
+        if not self.transient_done:
+            # Drop transients without recording them; orbits already on a cycle never iterate again
+            tail, cycle = logistic_map_batch(self.x, self.r_values, self.transient + 1, tail=depth, periods=True,
+                                             tolerance=self.tolerance)
+            settled = cycle['period'] > 0
+            self._settle(self._columns[settled], tail[settled, -MAX_DETECTED_PERIOD:], cycle['period'][settled])
+            self._running = self._columns[~settled]
+            self._history = tail[~settled]
+            self.x = tail[:, -1].copy()
+            self.transient_done = True
+
+        running = self._running
+        orbits = logistic_map_batch(self.x[running], self.r_values[running], iterations + 1)[:, 1:]
+        self.x[running] = orbits[:, -1]
+
+        rows = np.clip((orbits * self.height).astype(np.intp), 0, self.height - 1)
+        flat_index = (rows * self.width + running[:, None]).ravel()
+        if flat_index.size < self.image.size // 8:
+            # Once most columns have settled, touching only the visited pixels beats a full-image pass
+            visited, counts = np.unique(flat_index, return_counts=True)
+            self.image.ravel()[visited] += counts
+        else:
+            counts = np.bincount(flat_index, minlength=self.height * self.width)
+            self.image += counts.reshape(self.height, self.width)
+        self.image.ravel()[self._cycle_index] += iterations * self._cycle_weight
+        self.iterations_done += iterations
+
+        # Chunks are short, so cycles are looked for in the history carried across them
+        self._history = np.concatenate([self._history, orbits], axis=1)[:, -depth:]
+        if self._history.shape[1] == depth and running.size:
+            found = _cycle_periods(np.ascontiguousarray(self._history.T), depth - 1, self.tolerance)
+            settled = found > 0
+            if settled.any():
+                self._settle(running[settled], self._history[settled, -MAX_DETECTED_PERIOD:], found[settled])
+                self._running = running[~settled]
+                self._history = self._history[~settled]
+        return self.image
+
+# Logistic Map Lyapunov Exponent
+def _cycle_mean(values, period):
+    """Mean of the last ``period`` columns of every row of ``values``"""
+    width = values.shape[1]
+    on_cycle = np.arange(width) >= width - period[:, None]
+    return np.where(on_cycle, values, 0.0).sum(axis=1) / np.maximum(period, 1)
+
+def logistic_lyapunov(r, x0=0.3, iterations=1000, transient=500, chunk_size=256, progress=None, check_cancelled=None,
+                      periods=False):
+    """Lyapunov exponent of the logistic map for every growth rate in ``r``.
+
+    All orbits advance in lockstep through ``logistic_map_batch``; the
+    exponent is the orbit average of ``log|r (1 - 2x)|`` after ``transient``
+    iterations. Positive values mark chaos, negative values stable cycles.
+    Orbits found on a periodic cycle stop iterating and average over the
+    cycle instead, so periodic windows cost little. Returns an array shaped
+    like ``r`` (and ``x0``, broadcast together), and with ``periods`` also
+    the detected period of every orbit (0 where none was found).
+    """
+    shape = np.broadcast(np.asarray(x0), np.asarray(r)).shape
+    r = np.broadcast_to(np.asarray(r, dtype=float), shape).ravel()
+    x0 = np.broadcast_to(np.asarray(x0, dtype=float), shape).ravel()
+
+    def log_derivative(orbits, rates):
+        # Superstable orbits hit x = 1/2 exactly; clamp instead of taking log(0)
+        return np.log(np.maximum(np.abs(rates[:, None] * (1.0 - 2.0 * orbits)), 1e-300))
+
+    tail, cycle = logistic_map_batch(x0, r, transient + 1, tail=MAX_DETECTED_PERIOD, periods=True)
+    period = cycle['period']
+    x = tail[:, -1].copy()
+    total = np.zeros(r.size)
+    settled = np.flatnonzero(period)
+    total[settled] = iterations * _cycle_mean(log_derivative(tail[settled], r[settled]), period[settled])
+
+    active = np.flatnonzero(period == 0)
+    done = 0
+    while done < iterations and active.size:
+        if check_cancelled is not None:
+            check_cancelled()
+        n = min(chunk_size, iterations - done)
+        orbits, cycle = logistic_map_batch(x[active], r[active], n + 1, periods=True)
+        logs = log_derivative(orbits[:, :-1], r[active])
+        total[active] += logs.sum(axis=1)
+        x[active] = orbits[:, -1]
+        done += n
+
+        # Orbits that settled during this chunk repeat its last cycle for the remaining iterations
+        found = cycle['period'] > 0
+        if found.any():
+            total[active[found]] += (iterations - done) * _cycle_mean(logs[found], cycle['period'][found])
+            period[active[found]] = cycle['period'][found]
+            active = active[~found]
+        if progress is not None:
+            progress(done / iterations)
+    if progress is not None:
+        progress(1.0)
+
+    exponents = (total / iterations).reshape(shape)
+    if periods:
+        return exponents, period.reshape(shape)
+    return exponents
+
+# Lorenz Equations
+def lorenz(state, t, sigma, rho, beta):
+    """Lorenz system differential equations"""
+    x, y, z = state
+    dxdt = sigma * (y - x)
+    dydt = x * (rho - z) - y
+    dzdt = x * y - beta * z
+    return [dxdt, dydt, dzdt]
+
+# Lorenz Jacobian
+def lorenz_jacobian(state, t, sigma, rho, beta):
+    """Analytic Jacobian of the Lorenz system (odeint ``Dfun`` signature)"""
+    x, y, z = state
+    return np.array([
+        [-sigma, sigma, 0.0],
+        [rho - z, -1.0, -x],
+        [y, x, -beta],
+    ])
+
+# Lorenz Equations for solve_ivp
+def lorenz_ivp(t, state, sigma, rho, beta):
+    """Lorenz right-hand side accepting a (3,) state or a (3, k) batch"""
+    x, y, z = state
+    return np.array([sigma * (y - x), x * (rho - z) - y, x * y - beta * z])
+
+def lorenz_ivp_jacobian(t, state, sigma, rho, beta):
+    """Analytic Jacobian with the solve_ivp ``jac`` signature"""
+    return lorenz_jacobian(state, t, sigma, rho, beta)
+
+# Vectorized Lorenz Equations
+def lorenz_batch(states, sigma, rho, beta, out=None):
+    """Lorenz derivatives for a (3, N) array of states"""
+    x, y, z = states
+    if out is None:
+        out = np.empty_like(states)
+    np.subtract(y, x, out=out[0])
+    out[0] *= sigma
+    np.subtract(rho, z, out=out[1])
+    out[1] *= x
+    out[1] -= y
+    np.multiply(x, y, out=out[2])
+    out[2] -= beta * z
+    return out
+
+# Fixed-Step RK4
+def _rk4_step(derivative, state, dt, sigma, rho, beta, work):
+    """Advance ``state`` in place by one classic RK4 step of ``derivative``.
+
+    ``work`` holds five arrays shaped like ``state`` (k1, k2, k3, k4 and the
+    stage input), reused from step to step so the loop allocates nothing.
+    """
+    k1, k2, k3, k4, stage = work
+    half_dt = 0.5 * dt
+    derivative(state, sigma, rho, beta, out=k1)
+    np.multiply(k1, half_dt, out=stage)
+    stage += state
+    derivative(stage, sigma, rho, beta, out=k2)
+    np.multiply(k2, half_dt, out=stage)
+    stage += state
+    derivative(stage, sigma, rho, beta, out=k3)
+    np.multiply(k3, dt, out=stage)
+    stage += state
+    derivative(stage, sigma, rho, beta, out=k4)
+
+    # state += dt / 6 * (k1 + 2 k2 + 2 k3 + k4)
+    k2 += k3
+    k2 *= 2.0
+    k2 += k1
+    k2 += k4
+    k2 *= dt / 6.0
+    state += k2
+
+# Ensemble Lorenz Integrator
+def integrate_lorenz_ensemble(initial_states, dt, n_steps, sigma=10.0, rho=28.0, beta=8.0/3.0, stride=1,
+                              progress=None, check_cancelled=None):
+    """Advance N Lorenz trajectories together with the classic RK4 scheme.
+
+    ``initial_states`` is a (3,) or (N, 3) array and ``sigma``, ``rho`` and
+    ``beta`` may be scalars or length-N arrays, so one call can cover many
+    initial states, many parameter triples, or both. Every ``stride``-th step
+    is recorded; the result has shape (n_steps // stride + 1, N, 3) and starts
+    with the initial states. ``progress`` and ``check_cancelled`` are called
+    every 256 steps.
+    """
+    sigma, rho, beta = (np.atleast_1d(np.asarray(p, dtype=float)) for p in (sigma, rho, beta))
+    initial_states = np.atleast_2d(np.asarray(initial_states, dtype=float))
+    n = max(initial_states.shape[0], sigma.size, rho.size, beta.size)
+    # Component-major (3, N) layout keeps every arithmetic pass contiguous
+    state = np.array(np.broadcast_to(initial_states, (n, 3)).T, order='C')
+    sigma, rho, beta = (np.broadcast_to(p, (n,)) for p in (sigma, rho, beta))
+
+    n_out = n_steps // stride + 1
+    trajectory = np.empty((n_out, n, 3))
+    trajectory[0] = state.T
+
+    work = [np.empty_like(state) for _ in range(5)]
+    for step in range(1, n_steps + 1):
+        _rk4_step(lorenz_batch, state, dt, sigma, rho, beta, work)
+        if step % stride == 0:
+            trajectory[step // stride] = state.T
+        if step % 256 == 0:
+            if check_cancelled is not None:
+                check_cancelled()
+            if progress is not None:
+                progress(step / n_steps)
+    return trajectory
+
+# Ensemble Spread
+def ensemble_spread(trajectory):
+    """RMS distance of the members from the ensemble mean at every recorded time.
+
+    ``trajectory`` is an (n_times, N, 3) array as returned by
+    ``integrate_lorenz_ensemble``; the result has shape (n_times,).
+    """
+    deviation = trajectory - trajectory.mean(axis=1, keepdims=True)
+    return np.sqrt(np.einsum('tij,tij->t', deviation, deviation) / trajectory.shape[1])
+
+# Lorenz Equations with Tangent Dynamics
+def lorenz_tangent_batch(states, sigma, rho, beta, out=None):
+    """Derivatives of a (12, N) array: N states and their three tangent vectors.
+
+    Rows 0-2 hold the states, rows 3-11 the tangent matrices ``Q`` with
+    ``Q[i, j]`` (component ``i`` of vector ``j``) in row ``3 + 3 i + j``; the
+    tangent vectors evolve as ``dQ/dt = J(state) Q``.
+    """
+    if out is None:
+        out = np.empty_like(states)
+    lorenz_batch(states[:3], sigma, rho, beta, out=out[:3])
+    x, y, z = states[:3]
+    q = states[3:].reshape(3, 3, -1)
+    dq = out[3:].reshape(3, 3, -1)
+    # Rows of the Lorenz Jacobian applied to all three tangent vectors at once
+    np.subtract(q[1], q[0], out=dq[0])
+    dq[0] *= sigma
+    np.multiply(rho - z, q[0], out=dq[1])
+    dq[1] -= q[1]
+    dq[1] -= x * q[2]
+    np.multiply(y, q[0], out=dq[2])
+    dq[2] += x * q[1]
+    dq[2] -= beta * q[2]
+    return out
+
+# Lorenz Lyapunov Spectrum
+def lorenz_lyapunov_spectrum(initial_states, dt, n_steps, sigma=10.0, rho=28.0, beta=8.0/3.0, renormalize_every=10,
+                             transient=1000, progress=None, check_cancelled=None):
+    """Full Lyapunov spectra of N Lorenz trajectories from one integration.
+
+    The states and their tangent vectors advance together with RK4. Every
+    ``renormalize_every`` steps the tangent vectors are re-orthonormalized by
+    a batched QR decomposition and ``log|diag(R)|`` accumulates into the
+    exponents; the first ``transient`` steps only align the vectors. Arguments
+    broadcast as in ``integrate_lorenz_ensemble``. Returns the exponents,
+    largest first, as a (3,) array for a single state or (N, 3) otherwise.
+    """
+    sigma, rho, beta = (np.atleast_1d(np.asarray(p, dtype=float)) for p in (sigma, rho, beta))
+    initial_states = np.asarray(initial_states, dtype=float)
+    single = initial_states.ndim == 1 and max(sigma.size, rho.size, beta.size) == 1
+    initial_states = np.atleast_2d(initial_states)
+    n = max(initial_states.shape[0], sigma.size, rho.size, beta.size)
+    sigma, rho, beta = (np.broadcast_to(p, (n,)) for p in (sigma, rho, beta))
+
+    state = np.empty((12, n))
+    state[:3] = np.broadcast_to(initial_states, (n, 3)).T
+    state[3:] = np.eye(3).reshape(9, 1)
+    tangent = state[3:].reshape(3, 3, n)
+
+    work = [np.empty_like(state) for _ in range(5)]
+    log_growth = np.zeros((n, 3))
+    diagonal = np.arange(3)
+    total_steps = transient + n_steps
+    for step in range(1, total_steps + 1):
+        _rk4_step(lorenz_tangent_batch, state, dt, sigma, rho, beta, work)
+        if step % renormalize_every == 0 or step == transient or step == total_steps:
+            # (N, 3, 3) matrices whose columns are the tangent vectors
+            q, r = np.linalg.qr(np.moveaxis(tangent, 2, 0))
+            growth = r[:, diagonal, diagonal]
+            # Keep the orientation of each vector so the decomposition stays continuous
+            q *= np.where(growth < 0, -1.0, 1.0)[:, None, :]
+            tangent[...] = np.moveaxis(q, 0, 2)
+            if step > transient:
+                log_growth += np.log(np.abs(growth))
+            if check_cancelled is not None:
+                check_cancelled()
+            if progress is not None:
+                progress(step / total_steps)
+
+    exponents = log_growth / (n_steps * dt)
+    return exponents[0] if single else exponents
+
+# Lorenz Dynamics Classification
+LORENZ_REGIMES = ('fixed point', 'limit cycle', 'chaos')
+
+def classify_lorenz_dynamics(largest_exponent, tolerance=0.05):
+    """Regime codes (indices into ``LORENZ_REGIMES``) from largest Lyapunov exponents.
+
+    A clearly negative exponent means convergence to a fixed point, one
+    within ``tolerance`` of zero a periodic orbit, a positive one chaos.
+    """
+    largest_exponent = np.asarray(largest_exponent)
+    return np.where(largest_exponent < -tolerance, 0, np.where(largest_exponent > tolerance, 2, 1))
+
+# Generate Initial Conditions from Logistic Map
+def generate_initial_conditions_from_logistic(seed, r=3.9, iterations=100):
+    """Generate initial conditions from logistic map; an array of seeds gives an (N, 3) array"""
+    if np.ndim(seed):
+        # One logistic orbit per seed, iterated in lockstep; columns reversed to (x, y, z)
+        return logistic_map_batch(seed, r, iterations, tail=3)[:, ::-1] * 20
+    logistic_values = logistic_map_batch(seed, r, iterations, tail=3)[0]
+    
+    # Use the last three iteration values from logistic map to set x, y and z values
+    x = logistic_values[-1] * 20  # Normalize [0, 1] -> [0, 20] range
+    y = logistic_values[-2] * 20  # Normalize [0, 1] -> [0, 20] range
+    z = logistic_values[-3] * 20  # Normalize [0, 1] -> [0, 20] range
+    
+    return [x, y, z]
+
+# Ensemble Initial Conditions
+ENSEMBLE_SEEDINGS = ('gaussian', 'logistic')
+
+def ensemble_initial_states(center, n_members, radius=1e-3, seeding='gaussian', seed=0.1):
+    """(n_members, 3) initial states in a small cloud around ``center``.
+
+    'gaussian' draws normal offsets with standard deviation ``radius`` from a
+    generator seeded by ``seed``. 'logistic' takes each member's offset from
+    ``generate_initial_conditions_from_logistic`` of its own seed, rescaled
+    from [0, 20] to [-radius, radius]. The first member always starts at
+    ``center``.
+    """
+    center = np.asarray(center, dtype=float)
+    if seeding == 'gaussian':
+        rng = np.random.default_rng(int(seed * 2**32))
+        offsets = rng.normal(scale=radius, size=(n_members, 3))
+    elif seeding == 'logistic':
+        # Seeds spread over (0, 1) by the golden ratio, away from the fixed points 0 and 1
+        seeds = 0.01 + 0.98 * ((seed + np.arange(n_members) * 0.6180339887498949) % 1.0)
+        offsets = (generate_initial_conditions_from_logistic(seeds) / 10.0 - 1.0) * radius
+    else:
+        raise ValueError(f"Unknown seeding '{seeding}', expected one of {ENSEMBLE_SEEDINGS}")
+    offsets[0] = 0.0
+    return center + offsets
+
+# Available Lorenz solver backends
+LORENZ_SOLVERS = ('odeint', 'RK45', 'DOP853', 'LSODA', 'rk4')
+
+def solve_lorenz(initial_state, t, sigma=10.0, rho=28.0, beta=8.0/3.0, solver='odeint',
+                 rtol=None, atol=None, substeps=1):
+    """Solve the Lorenz equations with the selected backend.
+
+    ``odeint`` uses the analytic Jacobian, the ``solve_ivp`` methods (RK45,
+    DOP853, LSODA) use a vectorized right-hand side, and ``rk4`` is the
+    fixed-step NumPy integrator taking ``substeps`` steps per output interval
+    of a uniform grid. Returns ``(solution, stats)`` where ``stats`` holds the
+    wall time and the RHS / Jacobian evaluation counts.
+    """
+    # scipy.integrate is slow to import; load it on the first solve
+    from scipy.integrate import odeint, solve_ivp
+    
+    t = np.asarray(t, dtype=float)
+    tolerances = {}
+    if rtol is not None:
+        tolerances['rtol'] = rtol
+    if atol is not None:
+        tolerances['atol'] = atol
+
+    start = time.perf_counter()
+    if len(t) == 1 and solver in LORENZ_SOLVERS:
+        # A one-point grid is just the initial state; odeint and solve_ivp cannot take zero steps
+        solution, nfev, njev = np.array([initial_state], dtype=float), 0, 0
+    elif solver == 'odeint':
+        solution, info = odeint(lorenz, initial_state, t, args=(sigma, rho, beta), Dfun=lorenz_jacobian,
+                                full_output=True, **tolerances)
+        nfev, njev = int(info['nfe'][-1]), int(info['nje'][-1])
+    elif solver in ('RK45', 'DOP853', 'LSODA'):
+        if solver == 'LSODA':
+            tolerances['jac'] = lorenz_ivp_jacobian
+        result = solve_ivp(lorenz_ivp, (t[0], t[-1]), initial_state, method=solver, t_eval=t,
+                           args=(sigma, rho, beta), vectorized=True, **tolerances)
+        if not result.success:
+            raise RuntimeError(f"{solver} failed: {result.message}")
+        solution, nfev, njev = result.y.T, int(result.nfev), int(result.njev)
+    elif solver == 'rk4':
+        dt = (t[-1] - t[0]) / max(len(t) - 1, 1)
+        if len(t) > 1 and not np.allclose(np.diff(t), dt):
+            raise ValueError("The rk4 solver needs a uniformly spaced time grid")
+        n_steps = (len(t) - 1) * substeps
+        solution = integrate_lorenz_ensemble(initial_state, dt / substeps, n_steps, sigma, rho, beta,
+                                             stride=substeps)[:, 0]
+        nfev, njev = 4 * n_steps, 0
+    else:
+        raise ValueError(f"Unknown solver '{solver}', expected one of {', '.join(LORENZ_SOLVERS)}")
+
+    stats = {
+        'solver': solver,
+        'wall_time': time.perf_counter() - start,
+        'nfev': nfev,
+        'njev': njev,
+    }
+    return solution, stats
+
+# Compact Trajectory Storage
+TRAJECTORY_STORAGE = ('float64', 'float32', 'int16')
+
+class CompactTrajectory:
+    """(N, 3) trajectory stored as float32, or as int16 with a per-axis scale and offset.
+
+    Indexing decodes only the requested rows back to float64, so it can stand
+    in for a solution array wherever rows are sliced (plotting, animation,
+    export). ``max_error`` is the largest per-axis reconstruction error
+    measured when the trajectory was encoded.
+    """
+    def __init__(self, data, storage, scale=(1.0, 1.0, 1.0), offset=(0.0, 0.0, 0.0), max_error=(0.0, 0.0, 0.0)):
+        self.data = data
+        self.storage = storage
+        self.scale = np.asarray(scale, dtype=float)
+        self.offset = np.asarray(offset, dtype=float)
+        self.max_error = np.asarray(max_error, dtype=float)
+
+    @classmethod
+    def encode(cls, solution, storage='float32', chunk_size=65536):
+        """Compress a float64 solution; the error is measured chunk by chunk against it"""
+        if storage not in ('float32', 'int16'):
+            raise ValueError(f"Unknown compact storage '{storage}', expected 'float32' or 'int16'")
+        solution = np.asarray(solution, dtype=float)
+        if storage == 'int16':
+            low, high = solution.min(axis=0), solution.max(axis=0)
+            # Map [low, high] onto the symmetric range [-32767, 32767]
+            offset = (low + high) / 2
+            scale = np.where(high > low, (high - low) / (2 * 32767), 1.0)
+            data = np.empty(solution.shape, dtype=np.int16)
+        else:
+            offset, scale = np.zeros(3), np.ones(3)
+            data = np.empty(solution.shape, dtype=np.float32)
+        compact = cls(data, storage, scale, offset)
+
+        max_error = np.zeros(3)
+        for start in range(0, len(solution), chunk_size):
+            chunk = solution[start:start + chunk_size]
+            if storage == 'int16':
+                data[start:start + chunk_size] = np.rint((chunk - offset) / scale)
+            else:
+                data[start:start + chunk_size] = chunk
+            error = np.abs(compact[start:start + chunk_size] - chunk)
+            if len(error):
+                np.maximum(max_error, error.max(axis=0), out=max_error)
+        compact.max_error = max_error
+        return compact
+
+    def _decode(self, values, axes=slice(None)):
+        if self.storage == 'float32':
+            return values.astype(float)
+        return values * self.scale[axes] + self.offset[axes]
+
+    def __getitem__(self, key):
+        # (rows, axes) keys decode only the selected axes, e.g. solution[:, 0]
+        if isinstance(key, tuple) and len(key) == 2:
+            return self._decode(self.data[key], key[1])
+        return self._decode(self.data[key])
+
+    def __array__(self, dtype=None, copy=None):
+        decoded = self._decode(self.data)
+        return decoded if dtype is None else decoded.astype(dtype)
+
+    def __len__(self):
+        return len(self.data)
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def ndim(self):
+        return self.data.ndim
+
+    @property
+    def dtype(self):
+        """Decoded dtype; ``data.dtype`` is the stored one"""
+        return np.dtype(float)
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+    def read_only_copy(self):
+        data = np.array(self.data)
+        data.setflags(write=False)
+        return CompactTrajectory(data, self.storage, self.scale, self.offset, self.max_error)
+
+    def metadata(self):
+        """Decoding parameters, as recorded next to an exported or cached trajectory"""
+        return {
+            'storage': self.storage,
+            'scale': self.scale.tolist(),
+            'offset': self.offset.tolist(),
+            'max_error': self.max_error.tolist(),
+        }
+
+def compact_trajectory(solution, storage='float64'):
+    """Encode a solution for ``storage``; float64 solutions pass through unchanged"""
+    if storage == 'float64':
+        return solution
+    return CompactTrajectory.encode(solution, storage)
+
+# Trajectory Cache
+class TrajectoryCache:
+    """LRU cache of Lorenz solutions bounded by a byte budget.
+
+    Entries are keyed on the parameters, initial state, time grid and solver
+    settings. When ``persist_dir`` is set, solutions are also written there as
+    ``.npz`` files (kept under ``max_disk_bytes``) and reloaded in later
+    sessions. Cached arrays are read-only because they are shared.
+    """
+    def __init__(self, max_bytes=256 * 1024 ** 2, persist_dir=None, max_disk_bytes=1024 ** 3):
+        self.max_bytes = max_bytes
+        self.persist_dir = persist_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if persist_dir is not None:
+            os.makedirs(persist_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(initial_state, t, sigma, rho, beta, solver, **options):
+        """Stable digest of everything that determines a solution"""
+        digest = hashlib.sha1()
+        digest.update(np.ascontiguousarray(initial_state, dtype=float).tobytes())
+        digest.update(np.ascontiguousarray(t, dtype=float).tobytes())
+        digest.update(repr((float(sigma), float(rho), float(beta), solver, sorted(options.items()))).encode())
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return ``(solution, stats)`` or None, updating the counters"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._load(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self._insert(key, *entry)
+        return entry
+
+    def put(self, key, solution, stats):
+        """Store a solution (array or ``CompactTrajectory``) and return the shared read-only copy"""
+        if isinstance(solution, CompactTrajectory):
+            solution = solution.read_only_copy()
+        else:
+            solution = np.array(solution)
+            solution.setflags(write=False)
+        self._insert(key, solution, dict(stats))
+        self._save(key, solution, stats)
+        return solution
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _insert(self, key, solution, stats):
+        if solution.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = (solution, stats)
+            self.current_bytes += solution.nbytes
+            # Evict least recently used entries until we fit the budget
+            while self.current_bytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+                self.evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self.persist_dir, f"{key}.npz")
+
+    def _load(self, key):
+        if self.persist_dir is None or not os.path.exists(self._path(key)):
+            return None
+        try:
+            with np.load(self._path(key)) as data:
+                solution = data['solution']
+                stats = json.loads(str(data['stats']))
+                compact = json.loads(str(data['compact'])) if 'compact' in data else None
+            os.utime(self._path(key))
+        except (OSError, ValueError, KeyError):
+            return None
+        solution.setflags(write=False)
+        if compact is not None:
+            solution = CompactTrajectory(solution, compact['storage'], compact['scale'], compact['offset'],
+                                         compact['max_error'])
+        return solution, stats
+
+    def _save(self, key, solution, stats):
+        if self.persist_dir is None:
+            return
+        try:
+            if isinstance(solution, CompactTrajectory):
+                np.savez(self._path(key), solution=solution.data, stats=json.dumps(stats),
+                         compact=json.dumps(solution.metadata()))
+            else:
+                np.savez(self._path(key), solution=solution, stats=json.dumps(stats))
+            self._trim_disk()
+        except OSError:
+            pass
+
+    def _trim_disk(self):
+        files = [os.path.join(self.persist_dir, name) for name in os.listdir(self.persist_dir) if name.endswith('.npz')]
+        files.sort(key=os.path.getmtime)
+        total = sum(os.path.getsize(path) for path in files)
+        for path in files:
+            if total <= self.max_disk_bytes:
+                break
+            total -= os.path.getsize(path)
+            os.remove(path)
+
+def _cache_budget(default_mb=256):
+    """Byte budget from LORENZ_CACHE_MB; a malformed or negative value falls back to the default"""
+    try:
+        megabytes = float(os.environ.get('LORENZ_CACHE_MB', default_mb))
+    except ValueError:
+        megabytes = default_mb
+    if not 0 <= megabytes < float('inf'):
+        megabytes = default_mb
+    return int(megabytes * 1024 ** 2)
+
+# Shared cache, empty until a caller opts in (the GUI does); LORENZ_CACHE_MB sets the budget
+# and LORENZ_CACHE_DIR enables persistence
+trajectory_cache = TrajectoryCache(
+    max_bytes=_cache_budget(),
+    persist_dir=os.environ.get('LORENZ_CACHE_DIR') or None,
+)
+
+# Solve Lorenz equations
+def lorenz_solution(initial_state, t, sigma=10.0, rho=28.0, beta=8.0/3.0, solver='odeint', return_stats=False,
+                    cache=False, storage='float64', **options):
+    """Solve Lorenz equations and return the result.
+
+    By default every call solves and returns a fresh, writable array. With
+    ``cache=True`` (``trajectory_cache``) or a ``TrajectoryCache``, solutions
+    are looked up and stored there and come back as shared read-only arrays.
+    With ``storage`` 'float32' or 'int16' the float64 solve is returned as a
+    ``CompactTrajectory`` and cached in that form.
+    """
+    if cache is True:
+        cache = trajectory_cache
+    key = None
+    if cache:
+        key_options = dict(options, storage=storage) if storage != 'float64' else options
+        key = TrajectoryCache.make_key(initial_state, t, sigma, rho, beta, solver, **key_options)
+        entry = cache.get(key)
+        if entry is not None:
+            solution, stats = entry
+            return (solution, dict(stats, cached=True)) if return_stats else solution
+
+    solution, stats = solve_lorenz(initial_state, t, sigma, rho, beta, solver=solver, **options)
+    solution = compact_trajectory(solution, storage)
+    if cache:
+        solution = cache.put(key, solution, stats)
+    if return_stats:
+        return solution, dict(stats, cached=False)
+    return solution
+
+# Quick low-resolution Lorenz solve
+def lorenz_preview(initial_state, t, sigma=10.0, rho=28.0, beta=8.0/3.0, max_points=1000, tolerance=1e-3):
+    """Coarse stand-in for ``lorenz_solution`` while the full solve runs.
+
+    Only every k-th time of ``t`` (at most ``max_points``) is requested, at a
+    loose ``odeint`` tolerance; it traces the same attractor in a few tens of
+    milliseconds but is not the same trajectory. Returns ``(t_coarse, solution)``.
+    """
+    t = np.asarray(t, dtype=float)
+    stride = max(1, int(np.ceil(len(t) / max_points)))
+    t_coarse = t[::stride]
+    solution, _ = solve_lorenz(initial_state, t_coarse, sigma, rho, beta, solver='odeint', rtol=tolerance, atol=tolerance)
+    return t_coarse, solution
+
+# Solve Lorenz equations in slices
+def solve_lorenz_chunked(initial_state, t, sigma=10.0, rho=28.0, beta=8.0/3.0, solver='odeint', chunk_size=2000,
+                         progress=None, check_cancelled=None, out=None, **options):
+    """Solve over consecutive slices of ``t`` so long runs can report progress and stop early.
+
+    Each slice restarts from the last state of the previous one. ``progress``
+    receives the completed fraction and ``check_cancelled`` is called before
+    every slice; it should raise to abandon the solve. The solution is written
+    into ``out`` when given.
+    """
+    t = np.asarray(t, dtype=float)
+    solution = np.empty((len(t), 3)) if out is None else out
+    solution[0] = initial_state
+    totals = {'solver': solver, 'wall_time': 0.0, 'nfev': 0, 'njev': 0}
+
+    start = 0
+    last = len(t) - 1
+    while start < last:
+        if check_cancelled is not None:
+            check_cancelled()
+        stop = min(start + chunk_size, last)
+        segment, stats = solve_lorenz(solution[start], t[start:stop + 1], sigma, rho, beta, solver=solver, **options)
+        solution[start + 1:stop + 1] = segment[1:]
+        for key in ('wall_time', 'nfev', 'njev'):
+            totals[key] += stats[key]
+        start = stop
+        if progress is not None:
+            progress(stop / last)
+    return solution, totals
+
+# Checkpointed Lorenz Trajectory
+class LorenzTrajectory:
+    """Lorenz trajectory on a uniform time grid that can be extended in place.
+
+    The final state and time act as a checkpoint: ``extend`` integrates only
+    the new segment and appends it to a buffer that grows geometrically, so
+    raising the horizon step by step costs amortized O(1) per sample.
+    """
+    def __init__(self, initial_state, dt, sigma=10.0, rho=28.0, beta=8.0/3.0, solver='odeint', t0=0.0,
+                 capacity=1024, **options):
+        self.initial_state = np.array(initial_state, dtype=float)
+        self.dt = dt
+        self.t0 = t0
+        self.sigma = sigma
+        self.rho = rho
+        self.beta = beta
+        self.solver = solver
+        self.options = options
+        self._states = np.empty((max(capacity, 1), 3))
+        self._states[0] = self.initial_state
+        self._size = 1
+
+    @classmethod
+    def from_solution(cls, solution, dt, sigma=10.0, rho=28.0, beta=8.0/3.0, solver='odeint', t0=0.0, **options):
+        """Wrap an already computed solution so it can be extended later"""
+        trajectory = cls(solution[0], dt, sigma, rho, beta, solver, t0, capacity=len(solution), **options)
+        trajectory._states[:len(solution)] = solution
+        trajectory._size = len(solution)
+        return trajectory
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def states(self):
+        return self._states[:self._size]
+
+    @property
+    def t(self):
+        return self.t0 + self.dt * np.arange(self._size)
+
+    @property
+    def final_state(self):
+        return self._states[self._size - 1].copy()
+
+    @property
+    def final_time(self):
+        return self.t0 + self.dt * (self._size - 1)
+
+    def matches(self, initial_state, dt, sigma, rho, beta, solver, t0=0.0):
+        """Whether this trajectory can serve a request with these settings"""
+        return (np.array_equal(self.initial_state, np.asarray(initial_state, dtype=float))
+                and (dt, sigma, rho, beta, solver, t0) == (self.dt, self.sigma, self.rho, self.beta, self.solver, self.t0))
+
+    def extend(self, n_samples, progress=None, check_cancelled=None):
+        """Integrate ``n_samples`` more samples from the checkpoint and append them"""
+        start = self._size - 1
+        stop = start + n_samples
+        self._reserve(stop + 1)
+        t = self.t0 + self.dt * np.arange(start, stop + 1)
+        _, stats = solve_lorenz_chunked(self._states[start], t, self.sigma, self.rho, self.beta, solver=self.solver,
+                                        progress=progress, check_cancelled=check_cancelled,
+                                        out=self._states[start:stop + 1], **self.options)
+        self._size = stop + 1
+        return stats
+
+    def extend_to(self, t_end, **kwargs):
+        """Extend the trajectory until it covers ``t_end``"""
+        n_samples = int(np.ceil((t_end - self.final_time) / self.dt - 1e-9))
+        if n_samples <= 0:
+            return None
+        return self.extend(n_samples, **kwargs)
+
+    def _reserve(self, size):
+        if size <= len(self._states):
+            return
+        grown = np.empty((max(size, 2 * len(self._states)), 3))
+        grown[:self._size] = self._states[:self._size]
+        self._states = grown
+
+# Streaming Lorenz Trajectory
+def iter_lorenz_chunks(initial_state, dt, n_steps, sigma=10.0, rho=28.0, beta=8.0/3.0, solver='odeint',
+                       chunk_size=65536, t0=0.0, **options):
+    """Yield ``(t, states)`` chunks of a trajectory as they are integrated.
+
+    Covers ``n_steps + 1`` samples on a uniform grid (the first chunk starts
+    with the initial state) while holding at most ``chunk_size`` samples at a
+    time. Each chunk restarts the solver from the previous final state, so
+    adaptive backends match a one-shot solve only while the horizon fits in a
+    single chunk; ``rk4`` continues the same fixed-step scheme across chunks,
+    but for one trajectory its NumPy steps are far slower than ``odeint``.
+    """
+    state = np.array(initial_state, dtype=float)
+    done = 0
+    while done < n_steps:
+        count = min(chunk_size, n_steps - done)
+        t = t0 + dt * np.arange(done, done + count + 1)
+        segment, _ = solve_lorenz(state, t, sigma, rho, beta, solver=solver, **options)
+        state = segment[-1].copy()
+        if done == 0:
+            yield t, segment
+        else:
+            yield t[1:], segment[1:]
+        done += count
+    if n_steps == 0:
+        yield np.array([t0]), state[None, :]
+
+class TrajectoryStats:
+    """Running reductions over trajectory chunks: final state, extent and moments"""
+    def __init__(self):
+        self.count = 0
+        self.final_state = None
+        self.final_time = None
+        self.minimum = np.full(3, np.inf)
+        self.maximum = np.full(3, -np.inf)
+        self.mean = np.zeros(3)
+        self._m2 = np.zeros(3)
+
+    def update(self, t, states):
+        """Fold one chunk into the running statistics"""
+        states = np.asarray(states)
+        n = len(states)
+        if n == 0:
+            return self
+        np.minimum(self.minimum, states.min(axis=0), out=self.minimum)
+        np.maximum(self.maximum, states.max(axis=0), out=self.maximum)
+
+        # Merge the chunk's mean and variance (Chan et al.)
+        chunk_mean = states.mean(axis=0)
+        chunk_m2 = ((states - chunk_mean) ** 2).sum(axis=0)
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean = self.mean + delta * (n / total)
+        self._m2 = self._m2 + chunk_m2 + delta ** 2 * (self.count * n / total)
+        self.count = total
+
+        self.final_state = states[-1].copy()
+        self.final_time = float(t[-1])
+        return self
+
+    @property
+    def variance(self):
+        return self._m2 / max(self.count, 1)
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'final_time': self.final_time,
+            'final_state': self.final_state.tolist() if self.final_state is not None else None,
+            'min': self.minimum.tolist(),
+            'max': self.maximum.tolist(),
+            'mean': self.mean.tolist(),
+            'std': self.std.tolist(),
+        }
+
+def summarize_lorenz_stream(initial_state, dt, n_steps, sigma=10.0, rho=28.0, beta=8.0/3.0, solver='odeint',
+                            chunk_size=65536, **options):
+    """Integrate in constant memory and return only the running reductions"""
+    stats = TrajectoryStats()
+    for t, states in iter_lorenz_chunks(initial_state, dt, n_steps, sigma, rho, beta, solver=solver,
+                                        chunk_size=chunk_size, **options):
+        stats.update(t, states)
+    return stats
+
+# Poincaré Section and Return Map
+def _hermite(p0, p1, m0, m1, s, derivative=0):
+    """Cubic Hermite interpolant on [0, 1] (slopes ``m`` scaled by the step) or its derivatives"""
+    s = s.reshape(s.shape + (1,) * (np.ndim(p0) - s.ndim))
+    if derivative == 0:
+        weights = (2 * s**3 - 3 * s**2 + 1, s**3 - 2 * s**2 + s, -2 * s**3 + 3 * s**2, s**3 - s**2)
+    elif derivative == 1:
+        weights = (6 * s**2 - 6 * s, 3 * s**2 - 4 * s + 1, 6 * s - 6 * s**2, 3 * s**2 - 2 * s)
+    else:
+        weights = (12 * s - 6, 6 * s - 4, 6 - 12 * s, 6 * s - 2)
+    return weights[0] * p0 + weights[1] * m0 + weights[2] * p1 + weights[3] * m1
+
+def _hermite_root(p0, p1, m0, m1, s, derivative=0, iterations=4):
+    """Newton iterations for a zero of the interpolant (or a derivative) inside [0, 1]"""
+    for _ in range(iterations):
+        value = _hermite(p0, p1, m0, m1, s, derivative)
+        slope = _hermite(p0, p1, m0, m1, s, derivative + 1)
+        step = np.divide(value, slope, out=np.zeros_like(value), where=slope != 0)
+        s = np.clip(s - step, 0.0, 1.0)
+    return s
+
+class PoincareSection:
+    """Streaming Poincaré section and return map of a Lorenz trajectory.
+
+    ``update(t, states)`` folds in one chunk, e.g. from ``iter_lorenz_chunks``
+    or a slice of a stored solution. Crossings of the plane
+    ``state[axis] == level`` (default z = ρ - 1) in ``direction`` (+1 upward,
+    -1 downward, 0 both) and local maxima of ``state[maxima_axis]`` are
+    located by vectorized sign changes, then refined on the cubic Hermite
+    interpolant built from the Lorenz vector field at the samples. The last
+    sample of every chunk is carried over, so crossings between chunks are
+    not lost. ``new_points`` and ``new_maxima`` hold only what the latest
+    ``update`` found, for consumers that show the section as it fills in.
+    """
+    def __init__(self, sigma=10.0, rho=28.0, beta=8.0/3.0, axis=2, level=None, direction=1, maxima_axis=2):
+        self.sigma = sigma
+        self.rho = rho
+        self.beta = beta
+        self.axis = axis
+        self.level = rho - 1.0 if level is None else level
+        self.direction = direction
+        self.maxima_axis = maxima_axis
+        self.samples = 0
+        self._carry = None
+        self._points, self._crossing_times = [], []
+        self._maxima, self._maxima_times = [], []
+        self.new_points, self.new_maxima = np.empty((0, 3)), np.empty(0)
+
+    def update(self, t, states):
+        """Add the crossings and maxima of one chunk of samples"""
+        self.new_points, self.new_maxima = np.empty((0, 3)), np.empty(0)
+        t = np.asarray(t, dtype=float)
+        states = np.asarray(states, dtype=float)
+        if len(states) == 0:
+            return self
+        self.samples += len(states)
+        derivatives = lorenz_batch(states.T, self.sigma, self.rho, self.beta).T
+        if self._carry is not None:
+            t = np.concatenate([self._carry[0], t])
+            states = np.concatenate([self._carry[1], states])
+            derivatives = np.concatenate([self._carry[2], derivatives])
+        self._carry = (t[-1:], states[-1:], derivatives[-1:])
+        if len(states) < 2:
+            return self
+
+        # Slopes over each interval, scaled to the unit interval of the interpolant
+        h = np.diff(t)[:, None]
+        p0, p1 = states[:-1], states[1:]
+        m0, m1 = derivatives[:-1] * h, derivatives[1:] * h
+
+        # Plane crossings: sign changes of the signed distance
+        distance = states[:, self.axis] - self.level
+        upward = (distance[:-1] < 0) & (distance[1:] >= 0)
+        downward = (distance[:-1] > 0) & (distance[1:] <= 0)
+        crossing = {1: upward, -1: downward}.get(self.direction, upward | downward)
+        i = np.flatnonzero(crossing)
+        if len(i):
+            a = self.axis
+            s = distance[i] / (distance[i] - distance[i + 1])
+            s = _hermite_root(p0[i, a] - self.level, p1[i, a] - self.level, m0[i, a], m1[i, a], s)
+            self.new_points = _hermite(p0[i], p1[i], m0[i], m1[i], s)
+            self._points.append(self.new_points)
+            self._crossing_times.append(t[i] + s * h[i, 0])
+
+        # Local maxima: the derivative changes sign from positive to non-positive
+        a = self.maxima_axis
+        rate = derivatives[:, a]
+        i = np.flatnonzero((rate[:-1] > 0) & (rate[1:] <= 0))
+        if len(i):
+            s = rate[i] / (rate[i] - rate[i + 1])
+            s = _hermite_root(p0[i, a], p1[i, a], m0[i, a], m1[i, a], s, derivative=1)
+            self.new_maxima = _hermite(p0[i, a], p1[i, a], m0[i, a], m1[i, a], s)
+            self._maxima.append(self.new_maxima)
+            self._maxima_times.append(t[i] + s * h[i, 0])
+        return self
+
+    @staticmethod
+    def _joined(parts, shape):
+        if len(parts) > 1:
+            # Collapse so repeated reads stay cheap
+            parts[:] = [np.concatenate(parts)]
+        return parts[0] if parts else np.empty(shape)
+
+    @property
+    def points(self):
+        """(M, 3) crossing points, in time order"""
+        return self._joined(self._points, (0, 3))
+
+    @property
+    def crossing_times(self):
+        return self._joined(self._crossing_times, (0,))
+
+    @property
+    def maxima(self):
+        """Successive local maxima of ``state[maxima_axis]``"""
+        return self._joined(self._maxima, (0,))
+
+    @property
+    def maxima_times(self):
+        return self._joined(self._maxima_times, (0,))
+
+    def section_coordinates(self):
+        """(M, 2) crossing points in the plane, i.e. without the ``axis`` coordinate"""
+        return np.delete(self.points, self.axis, axis=1)
+
+    def return_map(self):
+        """Pairs (m_n, m_{n+1}) of successive maxima, e.g. Lorenz's z-maxima map"""
+        maxima = self.maxima
+        return maxima[:-1], maxima[1:]
+
+def poincare_section(solution, dt, sigma=10.0, rho=28.0, beta=8.0/3.0, t0=0.0, chunk_size=65536, **options):
+    """Section a stored solution on a uniform grid chunk by chunk; returns the ``PoincareSection``"""
+    section = PoincareSection(sigma, rho, beta, **options)
+    for start in range(0, len(solution), chunk_size):
+        states = solution[start:start + chunk_size]
+        section.update(t0 + dt * np.arange(start, start + len(states)), states)
+    return section
+
+# Compare Lorenz solver backends
+def compare_lorenz_solvers(initial_state, t, sigma=10.0, rho=28.0, beta=8.0/3.0, solvers=LORENZ_SOLVERS, **options):
+    """Time every backend and measure its maximum deviation from a tight DOP853 reference.
+
+    Keep ``t`` short enough that the reference itself is trustworthy; chaotic
+    trajectories separate exponentially over long horizons.
+    """
+    reference, _ = solve_lorenz(initial_state, t, sigma, rho, beta, solver='DOP853', rtol=1e-12, atol=1e-12)
+    report = []
+    for solver in solvers:
+        solution, stats = solve_lorenz(initial_state, t, sigma, rho, beta, solver=solver, **options)
+        stats['max_error'] = float(np.abs(solution - reference).max())
+        report.append(stats)
+    return report
+
+def fastest_lorenz_solver(initial_state, t, tolerance, sigma=10.0, rho=28.0, beta=8.0/3.0, solvers=LORENZ_SOLVERS):
+    """Name of the fastest backend whose error stays within ``tolerance``"""
+    report = compare_lorenz_solvers(initial_state, t, sigma, rho, beta, solvers=solvers)
+    accurate = [stats for stats in report if stats['max_error'] <= tolerance]
+    if not accurate:
+        return None
+    return min(accurate, key=lambda stats: stats['wall_time'])['solver']
+
+# Generate chaotic numbers and 3D plot
+def generate_chaotic_numbers_and_3D_plot(seed, iterations, time_steps=10000, solver='odeint'):
+    """Get initial conditions from logistic map and solve Lorenz equations"""
+    # Get logistic map output (r=3.9) and use the last three values
+    initial_state = generate_initial_conditions_from_logistic(seed, r=3.9, iterations=iterations)
+    
+    # Set time steps
+    t = np.linspace(0, 100, time_steps)  # Adjust time range
+    
+    # Solve Lorenz system
+    solution = lorenz_solution(initial_state, t, solver=solver)
+    
+    # Get x, y and z values from solution
+    x_value = solution[-1, 0]  # x(t) value
+    y_value = solution[-1, 1]  # y(t) value
+    z_value = solution[-1, 2]  # z(t) value
+    
+    return x_value, y_value, z_value, solution, t
+
+# Generate chaotic numbers without keeping the trajectory
+def generate_chaotic_numbers(seed, iterations, time_steps=10000, solver='odeint', chunk_size=65536):
+    """Streamed variant of generate_chaotic_numbers_and_3D_plot returning only the final x, y, z"""
+    initial_state = generate_initial_conditions_from_logistic(seed, r=3.9, iterations=iterations)
+    
+    # Same grid as np.linspace(0, 100, time_steps); a single step is just the initial state
+    dt = 100.0 / max(time_steps - 1, 1)
+    stats = summarize_lorenz_stream(initial_state, dt, time_steps - 1, solver=solver, chunk_size=chunk_size)
+    
+    x_value, y_value, z_value = stats.final_state
+    return x_value, y_value, z_value
+
+# Bulk chaotic number stream
+class ChaoticStream:
+    """Reproducible stream of chaotic numbers from many logistic-seeded Lorenz trajectories.
+
+    The master ``seed`` is expanded through ``np.random.SeedSequence`` into
+    ``n_trajectories`` independent logistic seeds in (0.05, 0.95); the last
+    three values of each seed's orbit give its initial state, exactly as in
+    ``generate_initial_conditions_from_logistic``.
+    The ensemble then runs with the RK4 integrator and every
+    ``harvest_every``-th step contributes all 3 * ``n_trajectories``
+    coordinates after a ``warmup`` that settles the states onto the attractor.
+
+    With ``whiten='fraction'`` each coordinate ``v`` becomes the fractional
+    part of ``|v| * scale``, which is close to uniform on [0, 1); with
+    ``whiten=None`` the raw coordinates are returned. Values are buffered, so
+    the sequence depends only on the constructor arguments and not on how it
+    is split between calls.
+    """
+    def __init__(self, seed=0.1, n_trajectories=1024, dt=0.01, harvest_every=10, warmup=1000, whiten='fraction',
+                 scale=1e4, sigma=10.0, rho=28.0, beta=8.0/3.0, r=3.9, iterations=100):
+        if not 0 < seed < 1:
+            raise ValueError("The seed must lie strictly between 0 and 1")
+        if whiten not in ('fraction', None):
+            raise ValueError(f"Unknown whitening '{whiten}', expected 'fraction' or None")
+        self.dt = dt
+        self.harvest_every = harvest_every
+        self.whiten = whiten
+        self.scale = scale
+        self.sigma, self.rho, self.beta = sigma, rho, beta
+        self.values_produced = 0
+
+        # Iterates of one logistic orbit would only be shifted windows of the same sequence; the
+        # seed's bit pattern gives SeedSequence entropy, so every float seed yields its own member seeds
+        entropy = int(np.float64(seed).view(np.uint64))
+        seeds = np.random.default_rng(np.random.SeedSequence(entropy)).uniform(0.05, 0.95, n_trajectories)
+        tails = logistic_map_batch(seeds, r, iterations, tail=3)
+        self.states = tails[:, ::-1] * 20  # Same [0, 1] -> [0, 20] mapping as a single trajectory
+        self._advance(warmup)
+        self._buffer = np.empty(0)
+
+    def _advance(self, n_steps, stride=None):
+        trajectory = integrate_lorenz_ensemble(self.states, self.dt, n_steps, self.sigma, self.rho, self.beta,
+                                               stride=stride or max(n_steps, 1))
+        self.states = trajectory[-1].copy()
+        return trajectory[1:]
+
+    def values(self, n):
+        """Next ``n`` values as a float64 array"""
+        while len(self._buffer) < n:
+            per_harvest = self.states.size
+            harvests = -(-(n - len(self._buffer)) // per_harvest)
+            harvested = self._advance(harvests * self.harvest_every, self.harvest_every).ravel()
+            if self.whiten == 'fraction':
+                harvested = np.abs(harvested, out=harvested)
+                harvested *= self.scale
+                harvested %= 1.0
+            self._buffer = np.concatenate([self._buffer, harvested])
+        out, self._buffer = self._buffer[:n], self._buffer[n:]
+        self.values_produced += n
+        return out
+
+    def integers(self, n, bits=32):
+        """Next ``n`` whitened values quantized to unsigned ``bits``-bit integers"""
+        if self.whiten is None:
+            raise ValueError("Quantization needs whitened values in [0, 1)")
+        dtype = {8: np.uint8, 16: np.uint16, 32: np.uint32}[bits]
+        return (self.values(n) * 2.0 ** bits).astype(dtype)
+
+    def bytes(self, n):
+        """Next ``n`` raw bytes, one per whitened value"""
+        return self.integers(n, bits=8).tobytes()
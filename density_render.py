@@ -0,0 +1,129 @@
+"""
+Lorenz Attractor Visualizer - Density Renderer
+Trajectories binned into a fixed-resolution image, so drawing cost no longer grows with their length
+"""
+
+import numpy as np
+
+# Planes a trajectory can be projected onto; '3D' is an orthographic camera view
+DENSITY_PROJECTIONS = ('XY', 'XZ', 'YZ', '3D')
+DENSITY_SHADINGS = ('eq-hist', 'log', 'linear')
+
+_AXES = {'XY': (0, 1), 'XZ': (0, 2), 'YZ': (1, 2)}
+
+
+def camera_axes(elevation=30.0, azimuth=-60.0):
+    """(2, 3) screen right and up vectors of an orthographic camera, angles in degrees as in mplot3d"""
+    elevation, azimuth = np.radians(elevation), np.radians(azimuth)
+    right = [-np.sin(azimuth), np.cos(azimuth), 0.0]
+    up = [-np.sin(elevation) * np.cos(azimuth), -np.sin(elevation) * np.sin(azimuth), np.cos(elevation)]
+    return np.array([right, up])
+
+
+def trajectory_bounds(solution, chunk_size=1 << 20):
+    """Per-axis ``(minimum, maximum)`` of a solution, read chunk by chunk"""
+    low, high = np.full(3, np.inf), np.full(3, -np.inf)
+    for start in range(0, len(solution), chunk_size):
+        states = np.asarray(solution[start:start + chunk_size])
+        np.minimum(low, states.min(axis=0), out=low)
+        np.maximum(high, states.max(axis=0), out=high)
+    return low, high
+
+
+class DensityAccumulator:
+    """Fixed-size hit count image of a projected trajectory.
+
+    ``add`` projects a chunk of (k, 3) states and bins them with one
+    ``np.bincount`` pass, so rendering is linear in the number of samples
+    while the image, and the cost of showing it, stays at ``width`` x
+    ``height``. The 3-D bounds fix the image extent up front; for the '3D'
+    projection each axis is first scaled to a unit cube, as mplot3d does.
+    """
+    def __init__(self, bounds, projection='XY', width=800, height=800, elevation=30.0, azimuth=-60.0):
+        if projection not in DENSITY_PROJECTIONS:
+            raise ValueError(f"Unknown projection '{projection}', expected one of {DENSITY_PROJECTIONS}")
+        low, high = (np.asarray(b, dtype=float) for b in bounds)
+        self.projection = projection
+        self.width = width
+        self.height = height
+        self.counts = np.zeros((height, width), dtype=np.int64)
+        self.samples = 0
+
+        if projection == '3D':
+            self._center = (low + high) / 2
+            self._span = np.where(high > low, high - low, 1.0)
+            self._camera = camera_axes(elevation, azimuth)
+            # Frame the projected corners of the unit cube
+            corners = (np.indices((2, 2, 2)).reshape(3, -1).T - 0.5) @ self._camera.T
+            low_2d, high_2d = corners.min(axis=0), corners.max(axis=0)
+            self.extent = (low_2d[0], high_2d[0], low_2d[1], high_2d[1])
+        else:
+            i, j = _AXES[projection]
+            self.extent = (low[i], high[i], low[j], high[j])
+
+    def project(self, states):
+        """(k, 2) image-plane coordinates of (k, 3) states"""
+        states = np.asarray(states, dtype=float)
+        if self.projection == '3D':
+            return ((states - self._center) / self._span) @ self._camera.T
+        return states[:, _AXES[self.projection]]
+
+    def add(self, states):
+        """Bin one chunk of states into the image"""
+        points = self.project(states)
+        x_min, x_max, y_min, y_max = self.extent
+        columns = ((points[:, 0] - x_min) * (self.width / max(x_max - x_min, 1e-12))).astype(np.intp)
+        rows = ((points[:, 1] - y_min) * (self.height / max(y_max - y_min, 1e-12))).astype(np.intp)
+        np.clip(columns, 0, self.width - 1, out=columns)
+        np.clip(rows, 0, self.height - 1, out=rows)
+        self.counts += np.bincount(rows * self.width + columns,
+                                   minlength=self.width * self.height).reshape(self.height, self.width)
+        self.samples += len(points)
+        return self
+
+
+def shade_density(counts, shading='eq-hist'):
+    """Map hit counts to [0, 1]; empty pixels stay 0.
+
+    'log' compresses the range with log1p, 'eq-hist' equalizes the histogram
+    of the non-empty pixels so every brightness level covers about the same
+    number of pixels, and 'linear' just divides by the maximum.
+    """
+    counts = np.asarray(counts)
+    peak = counts.max() if counts.size else 0
+    if peak == 0:
+        return np.zeros(counts.shape)
+    if shading == 'linear':
+        return counts / peak
+    if shading == 'log':
+        return np.log1p(counts) / np.log1p(peak)
+    if shading == 'eq-hist':
+        levels, frequency = np.unique(counts[counts > 0], return_counts=True)
+        cdf = np.cumsum(frequency) / frequency.sum()
+        return np.where(counts > 0, np.interp(counts, levels, cdf), 0.0)
+    raise ValueError(f"Unknown shading '{shading}', expected one of {DENSITY_SHADINGS}")
+
+
+def bin_density(solution, projection='XY', width=800, height=800, elevation=30.0, azimuth=-60.0, chunk_size=1 << 20,
+                progress=None, check_cancelled=None):
+    """``DensityAccumulator`` holding a whole solution, binned one chunk at a time.
+
+    Works on in-memory, memory-mapped or compact solutions. The counts do not
+    depend on the shading, so one binning pass serves every ``shade_density``.
+    """
+    accumulator = DensityAccumulator(trajectory_bounds(solution, chunk_size), projection, width, height,
+                                     elevation, azimuth)
+    for start in range(0, len(solution), chunk_size):
+        if check_cancelled is not None:
+            check_cancelled()
+        accumulator.add(solution[start:start + chunk_size])
+        if progress is not None:
+            progress(min(start + chunk_size, len(solution)) / len(solution))
+    return accumulator
+
+
+def density_image(solution, projection='XY', width=800, height=800, shading='eq-hist', elevation=30.0, azimuth=-60.0,
+                  chunk_size=1 << 20):
+    """Shaded density image of a whole solution; returns ``(image, accumulator)``"""
+    accumulator = bin_density(solution, projection, width, height, elevation, azimuth, chunk_size)
+    return shade_density(accumulator.counts, shading), accumulator
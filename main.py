@@ -1,67 +1,113 @@
+import os
+import queue
+import threading
+import multiprocessing
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.integrate import odeint
-import tkinter as tk
-from tkinter import ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
-import matplotlib.animation as animation
 import matplotlib
-matplotlib.use('TkAgg')
+# Spawned pool workers re-run this file as __mp_main__ when it is the entry point; they need no GUI
+if __name__ != '__mp_main__':
+    matplotlib.use('TkAgg')
+    import tkinter as tk
+    from tkinter import ttk, filedialog
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from chaos_core import (
+    logistic_map, BifurcationAccumulator, logistic_lyapunov, integrate_lorenz_ensemble, lorenz_lyapunov_spectrum,
+    LORENZ_REGIMES, LORENZ_SOLVERS, TrajectoryCache, trajectory_cache, lorenz_preview, LorenzTrajectory,
+    iter_lorenz_chunks, TRAJECTORY_STORAGE, CompactTrajectory, compact_trajectory, ENSEMBLE_SEEDINGS,
+    ensemble_initial_states, ensemble_spread, PoincareSection, MAX_DETECTED_PERIOD,
+)
+# Defined in this module before the numerical core was split out; still importable from main
+from chaos_core import lorenz, generate_initial_conditions_from_logistic, lorenz_solution, generate_chaotic_numbers_and_3D_plot
+from trajectory_store import save_trajectory, open_trajectory
+from parameter_plane import PARAMETER_PLANES, ParameterPlaneScan
+from perf_trace import perf
+from attractor_animation import animation_axes, AttractorAnimator, EnsembleAnimator
+from animation_export import export_animation
+from density_render import DENSITY_PROJECTIONS, DENSITY_SHADINGS, bin_density, trajectory_bounds
+from attractor_plot import draw_attractor, draw_density
 
-# Logistic Map Formula
-def logistic_map(x0, r, iterations):
-    """Calculate the logistic map"""
-    x_values = np.zeros(iterations)
-    x_values[0] = x0
-    for i in range(1, iterations):
-        x_values[i] = r * x_values[i - 1] * (1 - x_values[i - 1])  # Logistic map equation
-    return x_values
+# Background computation
+class ComputationCancelled(Exception):
+    """Raised inside a worker when its computation has been superseded"""
 
-# Lorenz Equations
-def lorenz(state, t, sigma, rho, beta):
-    """Lorenz system differential equations"""
-    x, y, z = state
-    dxdt = sigma * (y - x)
-    dydt = x * (rho - z) - y
-    dzdt = x * y - beta * z
-    return [dxdt, dydt, dzdt]
+class BackgroundTask:
+    """Run a computation on a worker thread and report back through a queue.
 
-# Generate Initial Conditions from Logistic Map
-def generate_initial_conditions_from_logistic(seed, r=3.9, iterations=100):
-    """Generate initial conditions from logistic map"""
-    logistic_values = logistic_map(seed, r, iterations)
-    
-    # Use the last three iteration values from logistic map to set x, y and z values
-    x = logistic_values[-1] * 20  # Normalize [0, 1] -> [0, 20] range
-    y = logistic_values[-2] * 20  # Normalize [0, 1] -> [0, 20] range
-    z = logistic_values[-3] * 20  # Normalize [0, 1] -> [0, 20] range
-    
-    return [x, y, z]
+    The worker never touches Tk; the GUI drains ``messages`` from the main
+    thread with ``root.after``.
+    """
+    def __init__(self, compute):
+        self._compute = compute
+        self._cancel_event = threading.Event()
+        self.messages = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
 
-# Solve Lorenz equations
-def lorenz_solution(initial_state, t, sigma=10.0, rho=28.0, beta=8.0/3.0):
-    """Solve Lorenz equations and return the result"""
-    return odeint(lorenz, initial_state, t, args=(sigma, rho, beta))
+    def start(self):
+        self.thread.start()
+        return self
 
-# Generate chaotic numbers and 3D plot
-def generate_chaotic_numbers_and_3D_plot(seed, iterations, time_steps=10000):
-    """Get initial conditions from logistic map and solve Lorenz equations"""
-    # Get logistic map output (r=3.9) and use the last three values
-    initial_state = generate_initial_conditions_from_logistic(seed, r=3.9, iterations=iterations)
-    
-    # Set time steps
-    t = np.linspace(0, 100, time_steps)  # Adjust time range
-    
-    # Solve Lorenz system
-    solution = lorenz_solution(initial_state, t)
-    
-    # Get x, y and z values from solution
-    x_value = solution[-1, 0]  # x(t) value
-    y_value = solution[-1, 1]  # y(t) value
-    z_value = solution[-1, 2]  # z(t) value
-    
-    return x_value, y_value, z_value, solution, t
+    def cancel(self):
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self.cancelled:
+            raise ComputationCancelled()
+
+    def report_progress(self, fraction):
+        self.messages.put(('progress', fraction))
+
+    def report_partial(self, result):
+        """Hand an intermediate result (e.g. a coarse preview) to the GUI"""
+        self.messages.put(('partial', result))
+
+    def _run(self):
+        try:
+            result = self._compute(self)
+        except ComputationCancelled:
+            self.messages.put(('cancelled', None))
+        except Exception as e:
+            self.messages.put(('error', e))
+        else:
+            self.messages.put(('done', result))
+
+# Period Readout of r Sweeps
+def period_coord_formatter(r_values, periods):
+    """Toolbar readout with the detected period of the r column under the cursor.
+
+    ``periods`` is read on every mouse move, so an array filled in place
+    (such as a refining bifurcation diagram's) stays current.
+    """
+    def format_coord(x, y):
+        column = min(max(np.searchsorted(r_values, x), 0), len(r_values) - 1)
+        period = periods[column]
+        return f"r={x:.4f}, y={y:.4f}, period={period if period else 'none found'}"
+    return format_coord
+
+# Time step of the Lorenz panel; "Time Steps" sets the horizon in multiples of it
+LORENZ_DT = 0.01
+
+# Quiet period after the last Spinbox change before a live update starts
+LIVE_DEBOUNCE_MS = 150
+
+# Steps of tangent dynamics behind the Lyapunov exponents shown for the Lorenz panel
+LYAPUNOV_STEPS = 5000
+
+# Ensemble view: distance of the members from (1, 1, 1) and the number of recorded samples
+ENSEMBLE_RADIUS = 1e-3
+ENSEMBLE_FRAMES = 1000
+
+# Samples per Poincaré section chunk, and the shortest interval between redraws while it fills in
+SECTION_CHUNK = 65536
+SECTION_REDRAW_MS = 250
+
+# Density view image size, and how many binned projections of the shown trajectory are kept
+DENSITY_RESOLUTION = 800
+DENSITY_CACHE_SIZE = 8
 
 class LorenzVisualizerApp:
     def __init__(self, root):
@@ -72,10 +118,46 @@ class LorenzVisualizerApp:
         
         # Animation variables
         self.animation = None
+        self.animator = None
+        self.lod = None
+        # Density view axes, and the camera (elevation, azimuth) of its '3D' projection
+        self.density_ax = None
+        self.density_camera = (30.0, -60.0)
+        # Binned density counts of one solution by (projection, elevation, azimuth); re-shading reuses them
+        self.density_source = None
+        self.density_counts = {}
         self.current_solution = None
         self.current_t = None
+        self.current_metadata = None
         self.animation_running = False
         
+        # Bifurcation diagram variables
+        self.bifurcation = None
+        self.bifurcation_image = None
+        self.bifurcation_job = None
+        self.bifurcation_target = 0
+        
+        # Parameter plane scan
+        self.plane_scan = None
+        self.plane_image = None
+        self.plane_job = None
+        self.plane_click = None
+        
+        # Background computation in flight
+        self.task = None
+        
+        # Periodic refresh of the performance panel
+        self.perf_job = None
+        
+        # Pending debounced live update
+        self.live_job = None
+        
+        # Checkpointed trajectory behind the Lorenz panel
+        self.trajectory = None
+        
+        # Lorenz Lyapunov spectra by (σ, ρ, β)
+        self.lyapunov_spectra = {}
+        
         # Style configuration
         style = ttk.Style()
         style.theme_use('clam')
@@ -114,7 +196,12 @@ class LorenzVisualizerApp:
     def setup_left_panel(self, parent):
         # Title
         title = ttk.Label(parent, text="Scientific Visualizer", style='Title.TLabel')
-        title.grid(row=0, column=0, columnspan=2, pady=(0, 20), sticky=tk.W)
+        title.grid(row=0, column=0, pady=(0, 20), sticky=tk.W)
+        
+        # Live mode: parameter changes regenerate the plot after a short pause
+        self.live_var = tk.BooleanVar(value=False)
+        live_check = ttk.Checkbutton(parent, text="Live update", variable=self.live_var, command=self.toggle_live_mode)
+        live_check.grid(row=0, column=1, pady=(0, 20), sticky=tk.E)
         
         # Logistic Map Section
         logistic_frame = ttk.LabelFrame(parent, text="Logistic Map Parameters", padding="15")
@@ -140,7 +227,15 @@ class LorenzVisualizerApp:
         
         # Generate Logistic Map button
         logistic_btn = ttk.Button(logistic_frame, text="Generate Logistic Map", style='Modern.TButton', command=self.generate_logistic_map)
-        logistic_btn.grid(row=3, column=0, columnspan=2, pady=15, sticky=(tk.W, tk.E))
+        logistic_btn.grid(row=3, column=0, columnspan=2, pady=(15, 5), sticky=(tk.W, tk.E))
+        
+        # Bifurcation Diagram button
+        bifurcation_btn = ttk.Button(logistic_frame, text="Bifurcation Diagram", style='Modern.TButton', command=self.generate_bifurcation)
+        bifurcation_btn.grid(row=4, column=0, columnspan=2, pady=5, sticky=(tk.W, tk.E))
+        
+        # Lyapunov exponent button
+        lyapunov_btn = ttk.Button(logistic_frame, text="Lyapunov Exponent λ(r)", style='Modern.TButton', command=self.generate_lyapunov)
+        lyapunov_btn.grid(row=5, column=0, columnspan=2, pady=(5, 15), sticky=(tk.W, tk.E))
         
         # Lorenz Attractor Section
         lorenz_frame = ttk.LabelFrame(parent, text="Lorenz Attractor Parameters", padding="15")
@@ -170,9 +265,57 @@ class LorenzVisualizerApp:
         time_steps_spinbox = ttk.Spinbox(lorenz_frame, from_=1000, to=20000, textvariable=self.time_steps_var, width=15, increment=500)
         time_steps_spinbox.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5)
         
+        # Solver backend
+        ttk.Label(lorenz_frame, text="Solver:", style='Header.TLabel').grid(row=4, column=0, sticky=tk.W, pady=5)
+        self.solver_var = tk.StringVar(value='odeint')
+        solver_combo = ttk.Combobox(lorenz_frame, textvariable=self.solver_var, values=LORENZ_SOLVERS, width=13, state='readonly')
+        solver_combo.grid(row=4, column=1, sticky=(tk.W, tk.E), pady=5)
+        
+        # Storage of the solved trajectory; integration always runs in float64
+        ttk.Label(lorenz_frame, text="Storage:", style='Header.TLabel').grid(row=5, column=0, sticky=tk.W, pady=5)
+        self.storage_var = tk.StringVar(value='float64')
+        storage_combo = ttk.Combobox(lorenz_frame, textvariable=self.storage_var, values=TRAJECTORY_STORAGE, width=13, state='readonly')
+        storage_combo.grid(row=5, column=1, sticky=(tk.W, tk.E), pady=5)
+        
         # Generate Lorenz button
         lorenz_btn = ttk.Button(lorenz_frame, text="Generate Lorenz Attractor", style='Modern.TButton', command=self.generate_lorenz)
-        lorenz_btn.grid(row=4, column=0, columnspan=2, pady=15, sticky=(tk.W, tk.E))
+        lorenz_btn.grid(row=6, column=0, columnspan=2, pady=(15, 5), sticky=(tk.W, tk.E))
+        
+        # Trajectory files
+        save_btn = ttk.Button(lorenz_frame, text="Save Trajectory...", command=self.save_trajectory)
+        save_btn.grid(row=7, column=0, padx=(0, 5), pady=(5, 15), sticky=(tk.W, tk.E))
+        open_btn = ttk.Button(lorenz_frame, text="Open Trajectory...", command=self.open_trajectory)
+        open_btn.grid(row=7, column=1, padx=(5, 0), pady=5, sticky=(tk.W, tk.E))
+        
+        # Parameter plane explorer
+        ttk.Label(lorenz_frame, text="Plane:", style='Header.TLabel').grid(row=8, column=0, sticky=tk.W, pady=5)
+        self.plane_var = tk.StringVar(value='σ-ρ')
+        plane_combo = ttk.Combobox(lorenz_frame, textvariable=self.plane_var, values=list(PARAMETER_PLANES), width=13, state='readonly')
+        plane_combo.grid(row=8, column=1, sticky=(tk.W, tk.E), pady=5)
+        plane_btn = ttk.Button(lorenz_frame, text="Parameter Plane", style='Modern.TButton', command=self.generate_parameter_plane)
+        plane_btn.grid(row=9, column=0, columnspan=2, pady=(5, 15), sticky=(tk.W, tk.E))
+        
+        # Ensemble divergence
+        ttk.Label(lorenz_frame, text="Members:", style='Header.TLabel').grid(row=10, column=0, sticky=tk.W, pady=5)
+        self.members_var = tk.IntVar(value=500)
+        members_spinbox = ttk.Spinbox(lorenz_frame, from_=10, to=5000, textvariable=self.members_var, width=15, increment=100)
+        members_spinbox.grid(row=10, column=1, sticky=(tk.W, tk.E), pady=5)
+        ttk.Label(lorenz_frame, text="Seeding:", style='Header.TLabel').grid(row=11, column=0, sticky=tk.W, pady=5)
+        self.seeding_var = tk.StringVar(value='gaussian')
+        seeding_combo = ttk.Combobox(lorenz_frame, textvariable=self.seeding_var, values=ENSEMBLE_SEEDINGS, width=13, state='readonly')
+        seeding_combo.grid(row=11, column=1, sticky=(tk.W, tk.E), pady=5)
+        ensemble_btn = ttk.Button(lorenz_frame, text="Ensemble Divergence", style='Modern.TButton', command=self.generate_ensemble)
+        ensemble_btn.grid(row=12, column=0, columnspan=2, pady=(5, 15), sticky=(tk.W, tk.E))
+        
+        # Poincaré section and return map, streamed or from the plotted trajectory
+        ttk.Label(lorenz_frame, text="Section Steps:", style='Header.TLabel').grid(row=13, column=0, sticky=tk.W, pady=5)
+        self.section_steps_var = tk.IntVar(value=1000000)
+        section_spinbox = ttk.Spinbox(lorenz_frame, from_=10000, to=100000000, textvariable=self.section_steps_var, width=15, increment=100000)
+        section_spinbox.grid(row=13, column=1, sticky=(tk.W, tk.E), pady=5)
+        section_btn = ttk.Button(lorenz_frame, text="Poincaré Section", command=lambda: self.generate_poincare_section('stream'))
+        section_btn.grid(row=14, column=0, padx=(0, 5), pady=(5, 15), sticky=(tk.W, tk.E))
+        section_current_btn = ttk.Button(lorenz_frame, text="Section of Plot", command=lambda: self.generate_poincare_section('current'))
+        section_current_btn.grid(row=14, column=1, padx=(5, 0), pady=(5, 15), sticky=(tk.W, tk.E))
         
         # Animation Controls
         animation_frame = ttk.LabelFrame(parent, text="Animation Controls", padding="15")
@@ -188,6 +331,34 @@ class LorenzVisualizerApp:
         self.reset_btn = ttk.Button(animation_frame, text="Reset View", command=self.reset_view)
         self.reset_btn.grid(row=1, column=0, columnspan=2, pady=5, sticky=(tk.W, tk.E))
         
+        # Playback speed
+        ttk.Label(animation_frame, text="Samples/Frame:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        self.samples_per_frame_var = tk.IntVar(value=20)
+        samples_spinbox = ttk.Spinbox(animation_frame, from_=1, to=1000, textvariable=self.samples_per_frame_var, width=8, increment=5)
+        samples_spinbox.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5)
+        
+        ttk.Label(animation_frame, text="Target FPS:").grid(row=3, column=0, sticky=tk.W, pady=5)
+        self.target_fps_var = tk.IntVar(value=30)
+        fps_spinbox = ttk.Spinbox(animation_frame, from_=1, to=120, textvariable=self.target_fps_var, width=8, increment=5)
+        fps_spinbox.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5)
+        
+        # Static renderer: the decimated line, or a density image of one projection
+        ttk.Label(animation_frame, text="Renderer:").grid(row=4, column=0, sticky=tk.W, pady=5)
+        self.renderer_var = tk.StringVar(value='line')
+        renderer_combo = ttk.Combobox(animation_frame, textvariable=self.renderer_var, values=('line',) + DENSITY_PROJECTIONS, width=8, state='readonly')
+        renderer_combo.grid(row=4, column=1, sticky=(tk.W, tk.E), pady=5)
+        
+        ttk.Label(animation_frame, text="Shading:").grid(row=5, column=0, sticky=tk.W, pady=5)
+        self.shading_var = tk.StringVar(value='eq-hist')
+        shading_combo = ttk.Combobox(animation_frame, textvariable=self.shading_var, values=DENSITY_SHADINGS, width=8, state='readonly')
+        shading_combo.grid(row=5, column=1, sticky=(tk.W, tk.E), pady=5)
+        for var in (self.renderer_var, self.shading_var):
+            var.trace_add('write', lambda *args: self._on_renderer_change())
+        
+        # Offscreen export of the same animation to a file
+        export_btn = ttk.Button(animation_frame, text="Export Animation...", command=self.export_animation)
+        export_btn.grid(row=6, column=0, columnspan=2, pady=5, sticky=(tk.W, tk.E))
+        
         # Configure column weights
         animation_frame.columnconfigure(0, weight=1)
         animation_frame.columnconfigure(1, weight=1)
@@ -199,9 +370,43 @@ class LorenzVisualizerApp:
         self.result_label = ttk.Label(results_frame, text="Ready to generate visualizations...", style='Result.TLabel', wraplength=280)
         self.result_label.grid(row=0, column=0, sticky=tk.W)
         
+        self.progress_var = tk.DoubleVar(value=0.0)
+        self.progress_bar = ttk.Progressbar(results_frame, variable=self.progress_var, maximum=100.0, mode='determinate')
+        self.progress_bar.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        
+        # Performance instrumentation, collapsed by default
+        perf_frame = ttk.Frame(parent)
+        perf_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E))
+        self.perf_toggle_btn = ttk.Button(perf_frame, text="▸ Performance", command=self.toggle_perf_panel)
+        self.perf_toggle_btn.grid(row=0, column=0, sticky=tk.W)
+        
+        self.perf_panel = ttk.LabelFrame(perf_frame, text="Performance", padding="10")
+        self.perf_enabled_var = tk.BooleanVar(value=False)
+        perf_check = ttk.Checkbutton(self.perf_panel, text="Record stage timings", variable=self.perf_enabled_var,
+                                     command=self.toggle_perf_recording)
+        perf_check.grid(row=0, column=0, columnspan=2, sticky=tk.W)
+        self.perf_memory_var = tk.BooleanVar(value=False)
+        memory_check = ttk.Checkbutton(self.perf_panel, text="Track peak memory (slower)", variable=self.perf_memory_var,
+                                       command=self.toggle_perf_recording)
+        memory_check.grid(row=1, column=0, columnspan=2, sticky=tk.W)
+        self.perf_label = ttk.Label(self.perf_panel, text="Recording is off", font=('Courier', 9), justify=tk.LEFT)
+        self.perf_label.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
+        perf_reset_btn = ttk.Button(self.perf_panel, text="Reset", command=self.reset_perf)
+        perf_reset_btn.grid(row=3, column=0, padx=(0, 5), sticky=(tk.W, tk.E))
+        perf_trace_btn = ttk.Button(self.perf_panel, text="Save Trace...", command=self.save_perf_trace)
+        perf_trace_btn.grid(row=3, column=1, padx=(5, 0), sticky=(tk.W, tk.E))
+        
+        # Live mode listens to every parameter
+        for var in (self.x0_var, self.r_var, self.iterations_var):
+            var.trace_add('write', lambda *args: self._on_parameter_change('logistic'))
+        for var in (self.sigma_var, self.rho_var, self.beta_var, self.time_steps_var, self.solver_var,
+                    self.storage_var):
+            var.trace_add('write', lambda *args: self._on_parameter_change('lorenz'))
+        
         # Configure column weights for left panel
-        for frame in [logistic_frame, lorenz_frame, results_frame]:
+        for frame in [logistic_frame, lorenz_frame, results_frame, self.perf_panel]:
             frame.columnconfigure(1, weight=1)
+        perf_frame.columnconfigure(0, weight=1)
     
     def setup_right_panel(self, parent):
         # Visualization area
@@ -249,29 +454,519 @@ class LorenzVisualizerApp:
                 self.result_label.config(text="Error: Iterations must be between 100 and 10000", foreground='red')
                 return
             
-            # Generate logistic map
-            x_values = logistic_map(x0, r, iterations)
+            # Generate logistic map on a worker thread
+            def compute(task):
+                with perf.stage('logistic_map'):
+                    return logistic_map(x0, r, iterations, periods=True)
+            
+            def show(result):
+                x_values, cycle = result
+                
+                # Clear and plot
+                self.clear_figure()
+                ax = self.fig.add_subplot(111)
+                with perf.stage('ax.plot'):
+                    ax.plot(x_values, color='#3498db', linewidth=1.5, alpha=0.8)
+                # Iteration stopped where the orbit was found on a cycle; the rest repeats it
+                if cycle['period']:
+                    ax.axvline(cycle['converged_at'], color='#e67e22', linewidth=1.0, linestyle='--', alpha=0.8)
+                    period_text = f"period {cycle['period']}"
+                else:
+                    period_text = 'no period found'
+                ax.set_title(f'Logistic Map (r={r}, x₀={x0}, {period_text})', fontsize=14, fontweight='bold', color='#2c3e50')
+                ax.set_xlabel('Iterations', fontsize=12, color='#34495e')
+                ax.set_ylabel('Value', fontsize=12, color='#34495e')
+                ax.grid(True, alpha=0.3)
+                ax.set_facecolor('#fafafa')
+                
+                with perf.stage('canvas.draw'):
+                    self.canvas.draw()
+                
+                # Update results
+                final_value = x_values[-1]
+                if cycle['period']:
+                    period_text = f"Period: {cycle['period']} (iterated to {cycle['converged_at']}, then repeated)"
+                else:
+                    period_text = f"Period: none up to {MAX_DETECTED_PERIOD}"
+                self.result_label.config(text=f"Logistic Map completed!\nFinal value: {final_value:.6f}\nIterations: {iterations}\n{period_text}", 
+                                       foreground='#27ae60')
+            
+            self.run_in_background(compute, show, "Computing logistic map...")
+            
+        except Exception as e:
+            self.result_label.config(text=f"Error: {str(e)}", foreground='red')
+    
+    def run_in_background(self, compute, on_done, message, on_partial=None):
+        """Start ``compute(task)`` on a worker thread, superseding any job in flight.
+
+        ``on_partial`` receives whatever the worker passes to ``task.report_partial``.
+        """
+        self.cancel_computation()
+        self.cancel_bifurcation()
+        self.cancel_parameter_plane()
+        
+        self.task = BackgroundTask(compute).start()
+        self.progress_var.set(0.0)
+        self.result_label.config(text=message, foreground='#3498db')
+        self.root.after(50, self._poll_task, self.task, on_done, on_partial)
+    
+    def _poll_task(self, task, on_done, on_partial=None):
+        # Results of a superseded job are dropped
+        if task is not self.task:
+            return
+        
+        while True:
+            try:
+                kind, payload = task.messages.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'progress':
+                self.progress_var.set(payload * 100.0)
+                continue
+            if kind == 'partial':
+                if on_partial is not None:
+                    on_partial(payload)
+                continue
             
-            # Clear and plot
-            self.fig.clear()
+            self.task = None
+            if kind == 'done':
+                self.progress_var.set(100.0)
+                try:
+                    on_done(payload)
+                except Exception as e:
+                    self.result_label.config(text=f"Error: {str(e)}", foreground='red')
+            elif kind == 'error':
+                self.progress_var.set(0.0)
+                self.result_label.config(text=f"Error: {str(payload)}", foreground='red')
+            return
+        
+        self.root.after(50, self._poll_task, task, on_done, on_partial)
+    
+    def cancel_computation(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+            self.progress_var.set(0.0)
+            return True
+        return False
+    
+    def halt_animation(self):
+        if self.animation is not None:
+            self.animation.event_source.stop()
+            self.animation = None
+        self.animation_running = False
+    
+    def clear_figure(self):
+        """Clear the figure for a new view; a blitted animation must not draw into the removed axes"""
+        self.halt_animation()
+        self.fig.clear()
+    
+    def generate_bifurcation(self):
+        try:
+            x0 = self.x0_var.get()
+            iterations = self.iterations_var.get()
+            
+            # Validation
+            if not (0 < x0 < 1):
+                self.result_label.config(text="Error: Initial seed must be between 0 and 1", foreground='red')
+                return
+            if not (100 <= iterations <= 10000):
+                self.result_label.config(text="Error: Iterations must be between 100 and 10000", foreground='red')
+                return
+            
+            self.cancel_computation()
+            self.cancel_bifurcation()
+            self.cancel_parameter_plane()
+            self.bifurcation = BifurcationAccumulator(r_min=2.5, r_max=4.0, x0=x0)
+            self.bifurcation_target = iterations
+            
+            # Density image, refined in place as chunks arrive
+            self.clear_figure()
             ax = self.fig.add_subplot(111)
-            ax.plot(x_values, color='#3498db', linewidth=1.5, alpha=0.8)
-            ax.set_title(f'Logistic Map (r={r}, x₀={x0})', fontsize=14, fontweight='bold', color='#2c3e50')
-            ax.set_xlabel('Iterations', fontsize=12, color='#34495e')
+            self.bifurcation_image = ax.imshow(self.bifurcation.image, origin='lower', aspect='auto', cmap='magma',
+                                               extent=[2.5, 4.0, 0.0, 1.0], interpolation='nearest')
+            ax.format_coord = period_coord_formatter(self.bifurcation.r_values, self.bifurcation.periods)
+            ax.set_title('Bifurcation Diagram', fontsize=14, fontweight='bold', color='#2c3e50')
+            ax.set_xlabel('Growth Rate (r)', fontsize=12, color='#34495e')
             ax.set_ylabel('Value', fontsize=12, color='#34495e')
-            ax.grid(True, alpha=0.3)
-            ax.set_facecolor('#fafafa')
             
-            self.canvas.draw()
+            self.bifurcation_job = self.root.after(1, self._bifurcation_step)
             
-            # Update results
-            final_value = x_values[-1]
-            self.result_label.config(text=f"Logistic Map completed!\nFinal value: {final_value:.6f}\nIterations: {iterations}", 
+        except Exception as e:
+            self.result_label.config(text=f"Error: {str(e)}", foreground='red')
+    
+    def _bifurcation_step(self):
+        self.bifurcation_job = None
+        accumulator = self.bifurcation
+        
+        # Coarse first chunk for a quick preview, larger chunks afterwards
+        chunk = 10 if accumulator.iterations_done == 0 else 100
+        chunk = min(chunk, self.bifurcation_target - accumulator.iterations_done)
+        image = accumulator.step(chunk)
+        
+        shaded = np.log1p(image)
+        self.bifurcation_image.set_data(shaded)
+        self.bifurcation_image.set_clim(0, max(shaded.max(), 1e-12))
+        self.canvas.draw_idle()
+        
+        done = accumulator.iterations_done
+        periodic = np.count_nonzero(accumulator.periods)
+        if done < self.bifurcation_target:
+            self.result_label.config(text=f"Bifurcation diagram refining...\nIterations per r: {done}/{self.bifurcation_target}\n"
+                                          f"Periodic r values: {periodic}/{accumulator.width}",
+                                   foreground='#3498db')
+            self.bifurcation_job = self.root.after(1, self._bifurcation_step)
+        else:
+            self.result_label.config(text=f"Bifurcation diagram completed!\nr values: {accumulator.width}\nIterations per r: {done}\n"
+                                          f"Periodic r values: {periodic} (no longer iterated)",
                                    foreground='#27ae60')
+    
+    def cancel_bifurcation(self):
+        if self.bifurcation_job is not None:
+            self.root.after_cancel(self.bifurcation_job)
+            self.bifurcation_job = None
+    
+    def generate_lyapunov(self):
+        try:
+            x0 = self.x0_var.get()
+            r = self.r_var.get()
+            iterations = self.iterations_var.get()
+            
+            # Validation
+            if not (0 < x0 < 1):
+                self.result_label.config(text="Error: Initial seed must be between 0 and 1", foreground='red')
+                return
+            if not (100 <= iterations <= 10000):
+                self.result_label.config(text="Error: Iterations must be between 100 and 10000", foreground='red')
+                return
+            
+            # Every growth rate in one vectorized pass on a worker thread
+            r_values = np.linspace(1.0, 4.0, 2000)
+            
+            def compute(task):
+                exponents, periods = logistic_lyapunov(r_values, x0=x0, iterations=iterations, progress=task.report_progress,
+                                                       check_cancelled=task.check_cancelled, periods=True)
+                return exponents, periods, float(logistic_lyapunov(r, x0=x0, iterations=iterations))
+            
+            def show(result):
+                exponents, periods, current = result
+                
+                self.clear_figure()
+                ax = self.fig.add_subplot(111)
+                ax.plot(r_values, exponents, color='#3498db', linewidth=0.8)
+                ax.axhline(0.0, color='#7f8c8d', linewidth=1.0, alpha=0.7)
+                if 1 <= r <= 4:
+                    ax.plot([r], [current], 'o', color='#e74c3c', markersize=6)
+                ax.set_ylim(max(exponents.min(), -3.0), max(exponents.max(), 0.0) + 0.2)
+                ax.format_coord = period_coord_formatter(r_values, periods)
+                ax.set_title(f'Lyapunov Exponent of the Logistic Map (x₀={x0})', fontsize=14, fontweight='bold', color='#2c3e50')
+                ax.set_xlabel('Growth Rate (r)', fontsize=12, color='#34495e')
+                ax.set_ylabel('λ', fontsize=12, color='#34495e')
+                ax.grid(True, alpha=0.3)
+                ax.set_facecolor('#fafafa')
+                
+                self.canvas.draw()
+                
+                chaotic = np.mean(exponents > 0) * 100
+                periodic = np.mean(periods > 0) * 100
+                self.result_label.config(text=f"Lyapunov exponent completed!\nλ(r={r}) = {current:.4f}\n"
+                                              f"Chaotic (λ > 0): {chaotic:.1f}% of r ∈ [1, 4]\n"
+                                              f"Periodic (cycle found): {periodic:.1f}%",
+                                       foreground='#27ae60')
+            
+            self.run_in_background(compute, show, "Computing Lyapunov exponents...")
+        
+        except Exception as e:
+            self.result_label.config(text=f"Error: {str(e)}", foreground='red')
+    
+    def generate_ensemble(self):
+        try:
+            sigma = self.sigma_var.get()
+            rho = self.rho_var.get()
+            beta = self.beta_var.get()
+            time_steps = self.time_steps_var.get()
+            members = self.members_var.get()
+            seeding = self.seeding_var.get()
+            samples_per_frame = self.samples_per_frame_var.get()
+            target_fps = self.target_fps_var.get()
+            
+            # Validation
+            if not (1000 <= time_steps <= 20000):
+                self.result_label.config(text="Error: Time steps must be between 1000 and 20000", foreground='red')
+                return
+            if not (10 <= members <= 5000):
+                self.result_label.config(text="Error: Members must be between 10 and 5000", foreground='red')
+                return
+            
+            # Record at most ENSEMBLE_FRAMES samples per member
+            stride = max(1, time_steps // ENSEMBLE_FRAMES)
+            
+            # All members are integrated together on a worker thread
+            def compute(task):
+                with perf.stage('ensemble'):
+                    initial_states = ensemble_initial_states([1.0, 1.0, 1.0], members, ENSEMBLE_RADIUS, seeding)
+                    trajectory = integrate_lorenz_ensemble(initial_states, LORENZ_DT, time_steps, sigma, rho, beta,
+                                                           stride=stride, progress=task.report_progress,
+                                                           check_cancelled=task.check_cancelled)
+                    spread = ensemble_spread(trajectory)
+                return trajectory, spread
+            
+            def show(result):
+                trajectory, spread = result
+                t = np.arange(len(trajectory)) * stride * LORENZ_DT
+                
+                # 3-D ensemble above the spread over time
+                self.clear_figure()
+                grid = self.fig.add_gridspec(2, 1, height_ratios=(3, 1))
+                self.ax = self.fig.add_subplot(grid[0], projection='3d')
+                spread_ax = self.fig.add_subplot(grid[1])
+                
+                # Fixed limits; the static axes become the blit background
+                low, high = trajectory.min(axis=(0, 1)), trajectory.max(axis=(0, 1))
+                self.ax.set_xlim([low[0], high[0]])
+                self.ax.set_ylim([low[1], high[1]])
+                self.ax.set_zlim([low[2], high[2]])
+                self.ax.set_title(f'Ensemble Divergence - {members} members ({seeding})', fontsize=14,
+                                  fontweight='bold', color='#2c3e50')
+                self.ax.set_xlabel('X', fontsize=12, color='#34495e')
+                self.ax.set_ylabel('Y', fontsize=12, color='#34495e')
+                self.ax.set_zlabel('Z', fontsize=12, color='#34495e')
+                spread_ax.set_xlim(0.0, t[-1])
+                spread_ax.set_ylim(spread.min() / 2, spread.max() * 2)
+                spread_ax.set_yscale('log')
+                spread_ax.set_xlabel('Time', fontsize=12, color='#34495e')
+                spread_ax.set_ylabel('Spread', fontsize=12, color='#34495e')
+                spread_ax.grid(True, alpha=0.3)
+                
+                def show_fps(fps):
+                    self.result_label.config(text=f"Ensemble running: {fps:.1f} FPS\n"
+                                                  f"{members} members, final spread {spread[-1]:.2f}",
+                                           foreground='#27ae60')
+                
+                # Playback speed in recorded samples, matching the single trajectory animation
+                self.animator = EnsembleAnimator(self.fig, self.ax, spread_ax, trajectory, t, spread,
+                                                 samples_per_second=samples_per_frame * target_fps / stride,
+                                                 target_fps=target_fps, on_fps=show_fps)
+                self.animation = self.animator.start()
+                self.animation_running = True
+                self.canvas.draw()
+                
+                # Spread grows roughly like exp(λ₁ t) until it saturates at the attractor size
+                self.result_label.config(text=f"Ensemble generated!\nσ={sigma}, ρ={rho}, β={beta:.2f}\n"
+                                              f"Members: {members} ({seeding}), radius {ENSEMBLE_RADIUS:g}\n"
+                                              f"Spread: {spread[0]:.1e} → {spread[-1]:.2f}",
+                                       foreground='#27ae60')
+            
+            self.run_in_background(compute, show, "Integrating ensemble...")
+        
+        except Exception as e:
+            self.result_label.config(text=f"Error: {str(e)}", foreground='red')
+    
+    def generate_poincare_section(self, source):
+        try:
+            if source == 'current':
+                # The plotted trajectory, including memory-mapped files, in slices
+                solution = self.current_solution
+                metadata = self.current_metadata or {}
+                if solution is None or metadata.get('system', 'lorenz') != 'lorenz':
+                    self.result_label.config(text="Error: Generate or open a Lorenz trajectory first!", foreground='red')
+                    return
+                sigma = metadata.get('sigma', self.sigma_var.get())
+                rho = metadata.get('rho', self.rho_var.get())
+                beta = metadata.get('beta', self.beta_var.get())
+                dt = metadata.get('dt', LORENZ_DT)
+                t0 = metadata.get('t0', 0.0)
+                n_samples = len(solution)
+                
+                def chunks():
+                    for start in range(0, n_samples, SECTION_CHUNK):
+                        states = solution[start:start + SECTION_CHUNK]
+                        yield t0 + dt * np.arange(start, start + len(states)), states
+            else:
+                sigma = self.sigma_var.get()
+                rho = self.rho_var.get()
+                beta = self.beta_var.get()
+                steps = self.section_steps_var.get()
+                solver = self.solver_var.get()
+                if not (10000 <= steps <= 100000000):
+                    self.result_label.config(text="Error: Section steps must be between 10000 and 100000000", foreground='red')
+                    return
+                n_samples = steps + 1
+                
+                # Integrated chunk by chunk, so memory stays constant however long the run
+                def chunks():
+                    return iter_lorenz_chunks([1.0, 1.0, 1.0], LORENZ_DT, steps, sigma, rho, beta, solver=solver,
+                                              chunk_size=SECTION_CHUNK)
+            
+            def compute(task):
+                section = PoincareSection(sigma, rho, beta)
+                for t, states in chunks():
+                    task.check_cancelled()
+                    with perf.stage('poincare section'):
+                        section.update(t, states)
+                    task.report_progress(section.samples / n_samples)
+                    # Only this chunk's results; the GUI keeps the rest
+                    task.report_partial((np.delete(section.new_points, section.axis, axis=1), section.new_maxima))
+                return section
+            
+            # Section in the plane next to the return map of successive z maxima
+            self.clear_figure()
+            section_ax = self.fig.add_subplot(121)
+            map_ax = self.fig.add_subplot(122)
+            section_points = section_ax.scatter([], [], s=1, color='#2980b9', linewidths=0)
+            map_points = map_ax.scatter([], [], s=1, color='#c0392b', linewidths=0)
+            diagonal, = map_ax.plot([], [], color='#7f8c8d', linewidth=0.8, linestyle='--')
+            section_ax.set_title(f'Poincaré Section z = ρ - 1 = {rho - 1:g}', fontsize=14, fontweight='bold', color='#2c3e50')
+            section_ax.set_xlabel('X', fontsize=12, color='#34495e')
+            section_ax.set_ylabel('Y', fontsize=12, color='#34495e')
+            map_ax.set_title('Return Map of z Maxima', fontsize=14, fontweight='bold', color='#2c3e50')
+            map_ax.set_xlabel('zₙ', fontsize=12, color='#34495e')
+            map_ax.set_ylabel('zₙ₊₁', fontsize=12, color='#34495e')
+            for ax in (section_ax, map_ax):
+                ax.grid(True, alpha=0.3)
+            self.canvas.draw()
+            
+            # Chunks found so far and the pending redraw; partials only append, redraws run at a fixed rate
+            found = {'points': [np.empty((0, 2))], 'maxima': [np.empty(0)], 'redraw': None}
+            
+            def show_partial(result):
+                points, maxima = result
+                found['points'].append(points)
+                found['maxima'].append(maxima)
+                if found['redraw'] is None:
+                    found['redraw'] = self.root.after(SECTION_REDRAW_MS, redraw)
+            
+            def redraw():
+                found['redraw'] = None
+                # Superseded by another view
+                if section_ax not in self.fig.axes:
+                    return
+                points = np.concatenate(found['points'])
+                maxima = np.concatenate(found['maxima'])
+                found['points'], found['maxima'] = [points], [maxima]
+                current, following = maxima[:-1], maxima[1:]
+                section_points.set_offsets(points)
+                map_points.set_offsets(np.column_stack([current, following]))
+                for ax, xs, ys in ((section_ax, points[:, 0], points[:, 1]), (map_ax, current, following)):
+                    if len(xs):
+                        margin_x = 0.05 * (xs.max() - xs.min()) or 1.0
+                        margin_y = 0.05 * (ys.max() - ys.min()) or 1.0
+                        ax.set_xlim(xs.min() - margin_x, xs.max() + margin_x)
+                        ax.set_ylim(ys.min() - margin_y, ys.max() + margin_y)
+                if len(current):
+                    low, high = min(current.min(), following.min()), max(current.max(), following.max())
+                    diagonal.set_data([low, high], [low, high])
+                self.canvas.draw_idle()
+                self.result_label.config(text=f"Computing Poincaré section...\n{len(points)} crossings, "
+                                              f"{len(current) + 1 if len(current) else 0} maxima",
+                                       foreground='#3498db')
+            
+            def show(section):
+                if found['redraw'] is not None:
+                    self.root.after_cancel(found['redraw'])
+                redraw()
+                source_text = "plotted trajectory" if source == 'current' else f"{n_samples - 1} steps streamed"
+                self.result_label.config(text=f"Poincaré section completed!\nσ={sigma}, ρ={rho}, β={beta:.2f}\n"
+                                              f"Source: {source_text}\n"
+                                              f"Crossings: {len(section.points)}, z maxima: {len(section.maxima)}",
+                                       foreground='#27ae60')
+            
+            self.run_in_background(compute, show, "Computing Poincaré section...", on_partial=show_partial)
+        
+        except Exception as e:
+            self.result_label.config(text=f"Error: {str(e)}", foreground='red')
+    
+    def generate_parameter_plane(self):
+        try:
+            plane = self.plane_var.get()
+            fixed = {'sigma': self.sigma_var.get(), 'rho': self.rho_var.get(), 'beta': self.beta_var.get()}
+            
+            # Stopping the animation also cancels any computation or scan in flight
+            self.stop_animation()
+            self.cancel_bifurcation()
+            self.plane_scan = ParameterPlaneScan(plane, fixed=fixed, initial_state=(1.0, 1.0, 1.0), dt=LORENZ_DT).start()
+            scan = self.plane_scan
+            
+            # Heatmap of the largest Lyapunov exponent, filled in tile by tile
+            self.clear_figure()
+            ax = self.fig.add_subplot(111)
+            self.plane_image = ax.imshow(scan.exponents, origin='lower', aspect='auto', cmap='coolwarm',
+                                         vmin=-1.5, vmax=1.5, interpolation='nearest',
+                                         extent=[scan.x_values[0], scan.x_values[-1], scan.y_values[0], scan.y_values[-1]])
+            self.fig.colorbar(self.plane_image, ax=ax, label='Largest Lyapunov exponent λ₁')
+            labels = {'sigma': 'Sigma (σ)', 'rho': 'Rho (ρ)', 'beta': 'Beta (β)'}
+            ax.set_title(f'Lorenz Parameter Plane ({plane})', fontsize=14, fontweight='bold', color='#2c3e50')
+            ax.set_xlabel(labels[scan.x_name], fontsize=12, color='#34495e')
+            ax.set_ylabel(labels[scan.y_name], fontsize=12, color='#34495e')
+            self.canvas.draw()
+            
+            # Clicking a cell loads its parameters into the Lorenz panel
+            self.plane_click = self.canvas.mpl_connect('button_press_event',
+                                                       lambda event: self._parameter_plane_click(event, scan, ax))
+            self.progress_var.set(0.0)
+            self.result_label.config(text=f"Scanning {plane} plane...\nTiles: 0/{len(scan.tiles)}", foreground='#3498db')
+            self.plane_job = self.root.after(100, self._parameter_plane_step)
             
         except Exception as e:
             self.result_label.config(text=f"Error: {str(e)}", foreground='red')
     
+    def _parameter_plane_step(self):
+        self.plane_job = None
+        scan = self.plane_scan
+        
+        try:
+            finished = scan.poll()
+        except Exception as e:
+            self.cancel_parameter_plane()
+            self.result_label.config(text=f"Error: {str(e)}", foreground='red')
+            return
+        
+        if finished:
+            self.plane_image.set_data(scan.exponents)
+            self.canvas.draw_idle()
+            self.progress_var.set(scan.tiles_done / len(scan.tiles) * 100.0)
+        
+        if not scan.done:
+            self.result_label.config(text=f"Scanning {scan.plane} plane...\nTiles: {scan.tiles_done}/{len(scan.tiles)}",
+                                   foreground='#3498db')
+            self.plane_job = self.root.after(100, self._parameter_plane_step)
+            return
+        
+        counts = np.bincount(scan.regimes().ravel(), minlength=len(LORENZ_REGIMES))
+        shares = ", ".join(f"{name} {count / counts.sum() * 100:.0f}%" for name, count in zip(LORENZ_REGIMES, counts))
+        self.result_label.config(text=f"Parameter plane completed!\n{shares}\nClick a cell to load its parameters",
+                               foreground='#27ae60')
+    
+    def _parameter_plane_click(self, event, scan, ax):
+        # Ignore clicks on other plots and while zooming or panning
+        toolbar = getattr(self, 'toolbar', None)
+        if event.inaxes is not ax or event.xdata is None or (toolbar is not None and toolbar.mode):
+            return
+        sigma, rho, beta = scan.cell_parameters(event.xdata, event.ydata)
+        self.sigma_var.set(round(sigma, 3))
+        self.rho_var.set(round(rho, 3))
+        self.beta_var.set(round(beta, 3))
+        # Generated right away; drop the live update the changes just scheduled
+        if self.live_job is not None:
+            self.root.after_cancel(self.live_job)
+            self.live_job = None
+        self.generate_lorenz()
+    
+    def cancel_parameter_plane(self):
+        if self.plane_click is not None:
+            self.canvas.mpl_disconnect(self.plane_click)
+            self.plane_click = None
+        if self.plane_job is not None:
+            self.root.after_cancel(self.plane_job)
+            self.plane_job = None
+        if self.plane_scan is not None and not self.plane_scan.done:
+            self.plane_scan.cancel()
+            self.plane_scan = None
+            self.progress_var.set(0.0)
+            return True
+        return False
+    
     def generate_lorenz(self):
         try:
             sigma = self.sigma_var.get()
@@ -287,56 +982,394 @@ class LorenzVisualizerApp:
             # Initial conditions
             initial_state = [1.0, 1.0, 1.0]
             
-            # Time array
-            t = np.linspace(0, 50, time_steps)
+            # Time array: a fixed step, so more time steps means a longer horizon
+            with perf.stage('time grid'):
+                t = np.arange(time_steps) * LORENZ_DT
+            solver = self.solver_var.get()
+            storage = self.storage_var.get()
+            compact = storage != 'float64'
+            storage_options = {'storage': storage} if compact else {}
+            cache_key = TrajectoryCache.make_key(initial_state, t, sigma, rho, beta, solver, chunked=True, **storage_options)
             
-            # Solve differential equation
-            solution = odeint(lorenz, initial_state, t, args=(sigma, rho, beta))
+            # Continue the previous trajectory when only the horizon changed; compact
+            # storage keeps no float64 copy to continue from
+            trajectory = None if compact else self.trajectory
+            if trajectory is not None and not trajectory.matches(initial_state, LORENZ_DT, sigma, rho, beta, solver):
+                trajectory = None
             
-            # Store for animation
-            self.current_solution = solution
-            self.current_t = t
+            # Lyapunov spectrum from the tangent dynamics, computed once per parameter set
+            spectrum_key = (sigma, rho, beta)
             
-            # Plot static 3D graph
-            self.plot_3d_graph(solution, t)
+            def lyapunov(task):
+                with perf.stage('lyapunov spectrum'):
+                    return lorenz_lyapunov_spectrum(initial_state, LORENZ_DT, LYAPUNOV_STEPS, sigma, rho, beta,
+                                                    progress=task.report_progress, check_cancelled=task.check_cancelled)
             
-            # Update results
-            self.result_label.config(text=f"Lorenz Attractor generated!\nσ={sigma}, ρ={rho}, β={beta:.2f}\nTime steps: {time_steps}", 
-                                   foreground='#27ae60')
+            # Live mode shows a coarse solve first when starting from scratch
+            preview = self.live_var.get()
+            density_key = self.density_key()
+            
+            # Solve differential equation on a worker thread
+            def compute(task):
+                extended_from = len(trajectory)
+                if preview and extended_from <= 1:
+                    with perf.stage('preview'):
+                        task.report_partial(lorenz_preview(initial_state, t, sigma, rho, beta))
+                with perf.stage(f'solve ({solver})'):
+                    stats = trajectory.extend(time_steps - extended_from, progress=task.report_progress,
+                                              check_cancelled=task.check_cancelled)
+                solution = trajectory.states[:time_steps]
+                if compact:
+                    with perf.stage(f'encode ({storage})'):
+                        solution = compact_trajectory(solution, storage)
+                with perf.stage('cache put'):
+                    solution = trajectory_cache.put(cache_key, solution, stats)
+                return solution, dict(stats, cached=False, extended_from=extended_from), bin_view(task, solution)
+            
+            # The density view is binned on the worker too, so showing it only shades the counts
+            def bin_view(task, solution):
+                if density_key is None:
+                    return None
+                with perf.stage('bin density'):
+                    return self.bin_density_view(solution, density_key, task)
+            
+            def show(result):
+                solution, stats, density = result
+                if density is not None:
+                    self.store_density(solution, density_key, density)
+                
+                # Store for animation
+                self.current_solution = solution
+                self.current_t = t
+                self.current_metadata = {
+                    'system': 'lorenz',
+                    'sigma': sigma,
+                    'rho': rho,
+                    'beta': beta,
+                    'initial_state': initial_state,
+                    't0': 0.0,
+                    'dt': LORENZ_DT,
+                    'solver': solver,
+                }
+                
+                # Plot static 3D graph
+                self.plot_3d_graph(solution, t)
+                
+                # Update results
+                cache_stats = trajectory_cache.stats()
+                if stats['cached']:
+                    source = "cached"
+                else:
+                    source = f"{stats['wall_time'] * 1000:.1f} ms, {stats['nfev']} RHS evals"
+                    if stats['extended_from'] > 1:
+                        source += f", extended from {stats['extended_from']} steps"
+                memory = f"Storage: {storage}, {solution.nbytes / 1e6:.2f} MB"
+                if isinstance(solution, CompactTrajectory):
+                    memory += f", max error {solution.max_error.max():.1e}"
+                def summary(exponent):
+                    return (f"Lorenz Attractor generated!\nσ={sigma}, ρ={rho}, β={beta:.2f}\nTime steps: {time_steps}\n"
+                            f"Solver: {solver} ({source})\n{memory}\n"
+                            f"Largest Lyapunov exponent: {exponent}\n"
+                            f"Cache: {cache_stats['hits'] + cache_stats['disk_hits']} hits, {cache_stats['misses']} misses, "
+                            f"{cache_stats['evictions']} evictions")
+                
+                exponents = self.lyapunov_spectra.get(spectrum_key)
+                if exponents is not None:
+                    self.result_label.config(text=summary(f"λ₁ = {exponents[0]:.3f}"), foreground='#27ae60')
+                    return
+                
+                # The attractor is already on screen; the exponents follow as their own job
+                def show_lyapunov(exponents):
+                    self.lyapunov_spectra[spectrum_key] = exponents
+                    self.result_label.config(text=summary(f"λ₁ = {exponents[0]:.3f}"), foreground='#27ae60')
+                
+                self.run_in_background(lyapunov, show_lyapunov, summary("computing..."))
+            
+            # Reuse a long enough or cached trajectory without solving again
+            entry = None
+            if trajectory is not None and len(trajectory) >= time_steps:
+                entry = (trajectory.states[:time_steps], {})
+            elif trajectory is None:
+                entry = trajectory_cache.get(cache_key)
+                if entry is not None:
+                    self.trajectory = None if compact else LorenzTrajectory.from_solution(entry[0], LORENZ_DT, sigma,
+                                                                                          rho, beta, solver)
+            if entry is not None:
+                solution, stats = entry[0], dict(entry[1], cached=True)
+                if density_key is None or self.cached_density(solution, density_key) is not None:
+                    self.cancel_computation()
+                    self.cancel_bifurcation()
+                    self.cancel_parameter_plane()
+                    show((solution, stats, None))
+                else:
+                    self.run_in_background(lambda task: (solution, stats, bin_view(task, solution)), show,
+                                           "Binning density image...")
+                return
+            
+            if trajectory is None:
+                trajectory = LorenzTrajectory(initial_state, LORENZ_DT, sigma, rho, beta, solver)
+            # Compact mode drops the float64 states once they are encoded
+            self.trajectory = None if compact else trajectory
+            self.run_in_background(compute, show, "Solving Lorenz system...", on_partial=self.show_lorenz_preview)
             
         except Exception as e:
             self.result_label.config(text=f"Error: {str(e)}", foreground='red')
     
-    def plot_3d_graph(self, solution, t):
-        # Clear previous plot
-        self.fig.clear()
+    def _on_renderer_change(self):
+        # Re-render only while the attractor itself is on screen
+        shown = self.lod.ax if self.lod is not None else self.density_ax
+        if self.current_solution is None or self.animation_running or shown not in self.fig.axes:
+            return
+        self.show_current_solution()
+    
+    def show_current_solution(self, message=None):
+        """Plot the current trajectory, binning a density view not seen before on a worker thread"""
+        solution, t = self.current_solution, self.current_t
+        key = self.density_key()
+        if key is None or self.cached_density(solution, key) is not None:
+            self.plot_3d_graph(solution, t)
+            if message is not None:
+                self.result_label.config(text=message, foreground='#3498db')
+            return
+        
+        def compute(task):
+            with perf.stage('bin density'):
+                return self.bin_density_view(solution, key, task)
+        
+        def show(density):
+            self.store_density(solution, key, density)
+            self.plot_3d_graph(solution, t)
+            self.result_label.config(text=message or f"Density view ready ({key[0]}).", foreground='#3498db')
+        
+        self.run_in_background(compute, show, "Binning density image...")
+    
+    def density_key(self):
+        """(projection, elevation, azimuth) of the density view to draw next, None for the line view"""
+        renderer = self.renderer_var.get()
+        if renderer == 'line':
+            return None
+        # Planar projections ignore the camera
+        if renderer != '3D':
+            return (renderer, 30.0, -60.0)
+        # The density camera follows the last rotation of the 3-D line view
+        camera = (self.lod.ax.elev, self.lod.ax.azim) if self.lod is not None else self.density_camera
+        return (renderer,) + tuple(camera)
+    
+    def cached_density(self, solution, key):
+        return self.density_counts.get(key) if solution is self.density_source else None
+    
+    def store_density(self, solution, key, accumulator):
+        if solution is not self.density_source:
+            self.density_source = solution
+            self.density_counts = {}
+        self.density_counts.pop(key, None)
+        self.density_counts[key] = accumulator
+        while len(self.density_counts) > DENSITY_CACHE_SIZE:
+            self.density_counts.pop(next(iter(self.density_counts)))
+    
+    @staticmethod
+    def bin_density_view(solution, key, task=None):
+        """Bin ``solution`` for the density view ``key``; safe to call on a worker thread"""
+        projection, elevation, azimuth = key
+        return bin_density(solution, projection, DENSITY_RESOLUTION, DENSITY_RESOLUTION, elevation, azimuth,
+                           progress=task.report_progress if task is not None else None,
+                           check_cancelled=task.check_cancelled if task is not None else None)
+    
+    def show_lorenz_preview(self, result):
+        _, solution = result
         
-        # Create 3D subplot
-        ax = self.fig.add_subplot(111, projection='3d')
+        # Reuse the 3-D axes already on screen so the view is kept and no new axes are built
+        if self.lod is not None and self.lod.ax in self.fig.axes:
+            with perf.stage('preview draw'):
+                self.lod.set_solution(solution)
+                self.lod.ax.auto_scale_xyz(solution[:, 0], solution[:, 1], solution[:, 2])
+                self.lod.update()
+        else:
+            self.plot_3d_graph(solution, None)
+        self.result_label.config(text="Preview shown (coarse)\nSolving at full resolution...", foreground='#3498db')
+    
+    def _on_parameter_change(self, target):
+        if not self.live_var.get():
+            return
+        # Coalesce bursts of Spinbox changes into one update
+        if self.live_job is not None:
+            self.root.after_cancel(self.live_job)
+        self.live_job = self.root.after(LIVE_DEBOUNCE_MS, self._live_update, target)
+    
+    def _live_update(self, target):
+        self.live_job = None
+        variables = {
+            'logistic': (self.x0_var, self.r_var, self.iterations_var),
+            'lorenz': (self.sigma_var, self.rho_var, self.beta_var, self.time_steps_var),
+        }[target]
+        try:
+            for var in variables:
+                var.get()
+        except tk.TclError:
+            # Still typing (e.g. an empty or partial number); wait for the next change
+            return
+        if target == 'logistic':
+            self.generate_logistic_map()
+        else:
+            self.generate_lorenz()
+    
+    def toggle_live_mode(self):
+        if self.live_var.get():
+            self._on_parameter_change('lorenz' if self.current_solution is not None else 'logistic')
+        elif self.live_job is not None:
+            self.root.after_cancel(self.live_job)
+            self.live_job = None
+    
+    def save_trajectory(self):
+        if self.current_solution is None:
+            self.result_label.config(text="Error: Generate Lorenz Attractor first!", foreground='red')
+            return
         
-        # Plot the attractor
-        x, y, z = solution[:, 0], solution[:, 1], solution[:, 2]
-        ax.plot(x, y, z, color='#e74c3c', linewidth=1, alpha=0.8)
+        path = filedialog.asksaveasfilename(title="Save Trajectory", defaultextension=".npy",
+                                            filetypes=[("NumPy trajectory", "*.npy")])
+        if not path:
+            return
+        
+        solution = self.current_solution
+        metadata = self.current_metadata or {}
         
-        # Styling
-        ax.set_title('Lorenz Attractor - 3D Trajectory', fontsize=14, fontweight='bold', color='#2c3e50')
-        ax.set_xlabel('X', fontsize=12, color='#34495e')
-        ax.set_ylabel('Y', fontsize=12, color='#34495e')
-        ax.set_zlabel('Z', fontsize=12, color='#34495e')
+        def compute(task):
+            return save_trajectory(path, solution, metadata, progress=task.report_progress,
+                                   check_cancelled=task.check_cancelled)
         
-        # Set background color
-        ax.xaxis.pane.fill = False
-        ax.yaxis.pane.fill = False
-        ax.zaxis.pane.fill = False
+        def show(saved_path):
+            self.result_label.config(text=f"Trajectory saved!\n{os.path.basename(saved_path)}\nSamples: {len(solution)}",
+                                   foreground='#27ae60')
+        
+        self.run_in_background(compute, show, "Saving trajectory...")
+    
+    def open_trajectory(self):
+        path = filedialog.askopenfilename(title="Open Trajectory", filetypes=[("NumPy trajectory", "*.npy")])
+        if not path:
+            return
+        
+        density_key = self.density_key()
+        
+        # Memory-mapped: samples are paged in only when drawn or binned
+        def compute(task):
+            solution, metadata = open_trajectory(path)
+            density = None
+            if density_key is not None:
+                with perf.stage('bin density'):
+                    density = self.bin_density_view(solution, density_key, task)
+            return solution, metadata, density
+        
+        def show(result):
+            solution, metadata, density = result
+            self.current_solution = solution
+            self.current_t = None
+            self.current_metadata = metadata
+            self.trajectory = None
+            if density is not None:
+                self.store_density(solution, density_key, density)
+            
+            self.plot_3d_graph(solution, None)
+            
+            params = ""
+            if {'sigma', 'rho', 'beta'} <= metadata.keys():
+                params = f"\nσ={metadata['sigma']}, ρ={metadata['rho']}, β={metadata['beta']:.2f}"
+            if isinstance(solution, CompactTrajectory):
+                params += f"\nStorage: {solution.storage}, max error {solution.max_error.max():.1e}"
+            self.result_label.config(text=f"Trajectory opened!\n{os.path.basename(path)}{params}\nSamples: {len(solution)}",
+                                   foreground='#27ae60')
+        
+        self.run_in_background(compute, show, "Opening trajectory...")
+    
+    def plot_3d_graph(self, solution, t):
+        renderer = self.renderer_var.get()
+        density_key = self.density_key()
+        if self.lod is not None:
+            # The density camera follows the last rotation of the 3-D line view
+            self.density_camera = (self.lod.ax.elev, self.lod.ax.azim)
+            self.lod.disconnect()
+            self.lod = None
+        
+        # draw_attractor and draw_density clear the figure themselves
+        self.halt_animation()
+        
+        if renderer == 'line':
+            # Plot the attractor through a level-of-detail subset
+            with perf.stage('draw_attractor'):
+                ax, self.lod = draw_attractor(self.fig, solution)
+            self.density_ax = None
+        else:
+            # Counts binned before (e.g. on a worker thread) are only re-shaded; previews are small enough to bin here
+            density = self.cached_density(solution, density_key)
+            if density is None:
+                density = self.bin_density_view(solution, density_key)
+                self.store_density(solution, density_key, density)
+            with perf.stage('draw_density'):
+                self.density_ax = draw_density(self.fig, solution, renderer, self.shading_var.get(), *self.density_camera,
+                                               resolution=DENSITY_RESOLUTION, accumulator=density)
         
         # Redraw canvas
-        self.canvas.draw()
+        with perf.stage('canvas.draw'):
+            self.canvas.draw()
         
         # Create toolbar if it doesn't exist
         if not hasattr(self, 'toolbar') or self.toolbar is None:
             self.toolbar = NavigationToolbar2Tk(self.canvas, self.toolbar_frame)
             self.toolbar.update()
     
+    def toggle_perf_panel(self):
+        if self.perf_panel.winfo_ismapped():
+            self.perf_panel.grid_remove()
+            self.perf_toggle_btn.config(text="▸ Performance")
+            if self.perf_job is not None:
+                self.root.after_cancel(self.perf_job)
+                self.perf_job = None
+        else:
+            self.perf_panel.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
+            self.perf_toggle_btn.config(text="▾ Performance")
+            self._refresh_perf_panel()
+    
+    def toggle_perf_recording(self):
+        if self.perf_enabled_var.get():
+            perf.enable(track_memory=self.perf_memory_var.get())
+        else:
+            perf.disable()
+        self._refresh_perf_panel(reschedule=False)
+    
+    def reset_perf(self):
+        perf.reset()
+        self._refresh_perf_panel(reschedule=False)
+    
+    def _refresh_perf_panel(self, reschedule=True):
+        if not perf.enabled:
+            text = "Recording is off"
+        else:
+            lines = [f"{'stage':<18}{'last':>8}{'mean':>8}{'n':>5}"]
+            for name, entry in perf.summary().items():
+                lines.append(f"{name[:18]:<18}{entry['last'] * 1000:>8.1f}{entry['mean'] * 1000:>8.1f}{entry['count']:>5}")
+            lines.append("(times in ms)")
+            if self.perf_memory_var.get():
+                lines.append(f"Peak memory: {perf.peak_memory / 1024 ** 2:.1f} MB")
+            fps = self.animator.measured_fps if self.animator is not None and self.animation_running else 0.0
+            lines.append(f"Animation FPS: {fps:.1f}" if fps else "Animation FPS: -")
+            text = "\n".join(lines)
+        self.perf_label.config(text=text)
+        
+        if reschedule:
+            self.perf_job = self.root.after(500, self._refresh_perf_panel)
+    
+    def save_perf_trace(self):
+        path = filedialog.asksaveasfilename(title="Save Performance Trace", defaultextension=".json",
+                                            filetypes=[("Chrome trace", "*.json")])
+        if not path:
+            return
+        try:
+            perf.dump_chrome_trace(path)
+            self.result_label.config(text=f"Trace saved!\n{os.path.basename(path)}\nEvents: {len(perf.events)}\n"
+                                          f"Open in chrome://tracing or ui.perfetto.dev",
+                                   foreground='#27ae60')
+        except Exception as e:
+            self.result_label.config(text=f"Error: {str(e)}", foreground='red')
+    
     def start_animation(self):
         if self.current_solution is None:
             self.result_label.config(text="Error: Generate Lorenz Attractor first!", foreground='red')
@@ -347,61 +1380,95 @@ class LorenzVisualizerApp:
         
         # Stop any existing animation
         self.stop_animation()
+        self.cancel_bifurcation()
+        self.cancel_parameter_plane()
         
-        # Create animation
-        self.fig.clear()
-        self.ax = self.fig.add_subplot(111, projection='3d')
-        
-        x, y, z = self.current_solution[:, 0], self.current_solution[:, 1], self.current_solution[:, 2]
-        
-        # Initialize empty line
-        self.line, = self.ax.plot([], [], [], color='#e74c3c', linewidth=2, alpha=0.8)
+        try:
+            samples_per_frame = self.samples_per_frame_var.get()
+            target_fps = self.target_fps_var.get()
+        except Exception as e:
+            self.result_label.config(text=f"Error: {str(e)}", foreground='red')
+            return
+        if not (1 <= samples_per_frame <= 1000) or not (1 <= target_fps <= 120):
+            self.result_label.config(text="Error: Samples/frame must be 1-1000 and target FPS 1-120", foreground='red')
+            return
         
-        # Set up the axes
-        self.ax.set_xlim([x.min(), x.max()])
-        self.ax.set_ylim([y.min(), y.max()])
-        self.ax.set_zlim([z.min(), z.max()])
-        self.ax.set_title('Lorenz Attractor - Animated', fontsize=14, fontweight='bold', color='#2c3e50')
-        self.ax.set_xlabel('X', fontsize=12, color='#34495e')
-        self.ax.set_ylabel('Y', fontsize=12, color='#34495e')
-        self.ax.set_zlabel('Z', fontsize=12, color='#34495e')
+        # Create animation; the axes are set up once and become the blit background
+        self.ax = animation_axes(self.fig, *trajectory_bounds(self.current_solution))
         
-        # Animation function
-        def animate(frame):
-            if frame < len(x):
-                self.line.set_data(x[:frame], y[:frame])
-                self.line.set_3d_properties(z[:frame])
-            return self.line,
+        def show_fps(fps):
+            self.result_label.config(text=f"Animation running: {fps:.1f} FPS\n"
+                                          f"{samples_per_frame} samples/frame, target {target_fps} FPS",
+                                   foreground='#27ae60')
         
         # Create and start animation
-        self.animation = animation.FuncAnimation(self.fig, animate, frames=len(x), 
-                                               interval=20, blit=False, repeat=True)
+        self.animator = AttractorAnimator(self.fig, self.ax, self.current_solution, samples_per_frame=samples_per_frame,
+                                          target_fps=target_fps, on_fps=show_fps)
+        self.animation = self.animator.start()
         self.animation_running = True
         self.canvas.draw()
         
         self.result_label.config(text="Animation started! Watch the attractor grow...", foreground='#27ae60')
     
+    def export_animation(self):
+        if self.current_solution is None:
+            self.result_label.config(text="Error: Generate Lorenz Attractor first!", foreground='red')
+            return
+        
+        try:
+            samples_per_frame = self.samples_per_frame_var.get()
+            fps = self.target_fps_var.get()
+        except Exception as e:
+            self.result_label.config(text=f"Error: {str(e)}", foreground='red')
+            return
+        if not (1 <= samples_per_frame <= 1000) or not (1 <= fps <= 120):
+            self.result_label.config(text="Error: Samples/frame must be 1-1000 and target FPS 1-120", foreground='red')
+            return
+        
+        path = filedialog.asksaveasfilename(title="Export Animation", defaultextension=".gif",
+                                            filetypes=[("GIF", "*.gif"), ("Animated PNG", "*.apng"),
+                                                       ("PNG sequence", "*.png")])
+        if not path:
+            return
+        
+        solution = self.current_solution
+        
+        def compute(task):
+            # Frames render in worker processes; this thread only waits and reports progress
+            return export_animation(solution, path, samples_per_frame=samples_per_frame, fps=fps,
+                                    progress=task.report_progress, check_cancelled=task.check_cancelled)
+        
+        def show(stats):
+            self.result_label.config(text=f"Animation exported!\n{os.path.basename(path)}\n"
+                                          f"{stats['frames']} frames on {stats['workers']} worker(s) "
+                                          f"in {stats['wall_time']:.1f}s",
+                                   foreground='#27ae60')
+        
+        self.run_in_background(compute, show, "Exporting animation...")
+    
     def stop_animation(self):
-        if self.animation is not None:
-            self.animation.event_source.stop()
-            self.animation = None
-        self.animation_running = False
-        self.result_label.config(text="Animation stopped.", foreground='#e67e22')
+        computation_cancelled = self.cancel_computation()
+        computation_cancelled = self.cancel_parameter_plane() or computation_cancelled
+        self.halt_animation()
+        if computation_cancelled:
+            self.result_label.config(text="Computation cancelled.", foreground='#e67e22')
+        else:
+            self.result_label.config(text="Animation stopped.", foreground='#e67e22')
     
     def reset_view(self):
+        self.cancel_computation()
+        self.cancel_bifurcation()
+        self.cancel_parameter_plane()
+        
         # Stop animation safely
-        if self.animation is not None:
-            self.animation.event_source.stop()
-            self.animation = None
-        self.animation_running = False
+        self.halt_animation()
         
         # Regenerate static plot if solution exists
         if self.current_solution is not None:
-            self.plot_3d_graph(self.current_solution, self.current_t)
-            self.result_label.config(text="View reset to static visualization.", foreground='#3498db')
+            self.show_current_solution("View reset to static visualization.")
         else:
             # Clear plot
-            self.fig.clear()
+            self.clear_figure()
             self.ax = self.fig.add_subplot(111)
             self.ax.text(0.5, 0.5, 'Click "Generate" to start visualization', 
                         horizontalalignment='center', verticalalignment='center', 
@@ -411,18 +1478,27 @@ class LorenzVisualizerApp:
             self.canvas.draw()
             self.result_label.config(text="Ready to generate visualizations...", foreground='#27ae60')
 
-def main():
+def main(on_ready=None):
     root = tk.Tk()
     app = LorenzVisualizerApp(root)
     
+    # Called once the event loop is up and the window has been drawn
+    if on_ready is not None:
+        root.after_idle(on_ready)
+    
     # Configure window closing
     def on_closing():
         if hasattr(app, 'animation') and app.animation is not None:
             app.animation.event_source.stop()
+        app.cancel_computation()
+        app.cancel_bifurcation()
+        app.cancel_parameter_plane()
         root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     root.mainloop()
 
 if __name__ == "__main__":
+    # Parameter plane workers are spawned processes; needed for frozen builds
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,115 @@
+"""
+Lorenz Attractor Visualizer - Parameter Plane Explorer
+Largest Lyapunov exponent over a (σ, ρ) or (ρ, β) grid, computed tile by tile on a process pool
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from chaos_core import lorenz_lyapunov_spectrum, classify_lorenz_dynamics
+
+# Planes that can be scanned: (x parameter, y parameter, x range, y range)
+PARAMETER_PLANES = {
+    'σ-ρ': ('sigma', 'rho', (1.0, 20.0), (1.0, 50.0)),
+    'ρ-β': ('rho', 'beta', (1.0, 50.0), (0.1, 10.0)),
+}
+
+
+def compute_tile(tile):
+    """Largest Lyapunov exponent of every cell in a tile, integrated as one ensemble"""
+    x, y = np.meshgrid(tile['x_values'], tile['y_values'])
+    params = dict(tile['fixed'])
+    params[tile['x_name']] = x.ravel()
+    params[tile['y_name']] = y.ravel()
+    exponents = lorenz_lyapunov_spectrum(tile['initial_state'], tile['dt'], tile['n_steps'], params['sigma'],
+                                         params['rho'], params['beta'], transient=tile['transient'])
+    return tile['rows'], tile['columns'], exponents[:, 0].reshape(x.shape)
+
+
+class ParameterPlaneScan:
+    """Progressive scan of one Lorenz parameter plane.
+
+    The grid is cut into ``tile_size`` x ``tile_size`` tiles that worker
+    processes integrate independently; ``poll`` copies finished tiles into
+    ``exponents`` (NaN until computed) without blocking, so a GUI can redraw
+    the heatmap as it fills in.
+    """
+    def __init__(self, plane='σ-ρ', resolution=60, fixed=None, initial_state=(1.0, 1.0, 1.0), dt=0.01,
+                 n_steps=2000, transient=500, tile_size=10, workers=None):
+        self.x_name, self.y_name, x_range, y_range = PARAMETER_PLANES[plane]
+        self.plane = plane
+        self.x_values = np.linspace(*x_range, resolution)
+        self.y_values = np.linspace(*y_range, resolution)
+        self.fixed = dict(fixed or {'sigma': 10.0, 'rho': 28.0, 'beta': 8.0 / 3.0})
+        self.exponents = np.full((resolution, resolution), np.nan)
+        self.tiles_done = 0
+
+        self.tiles = []
+        for row in range(0, resolution, tile_size):
+            for column in range(0, resolution, tile_size):
+                rows = slice(row, min(row + tile_size, resolution))
+                columns = slice(column, min(column + tile_size, resolution))
+                self.tiles.append({
+                    'rows': rows,
+                    'columns': columns,
+                    'x_name': self.x_name,
+                    'y_name': self.y_name,
+                    'x_values': self.x_values[columns],
+                    'y_values': self.y_values[rows],
+                    'fixed': self.fixed,
+                    'initial_state': list(initial_state),
+                    'dt': dt,
+                    'n_steps': n_steps,
+                    'transient': transient,
+                })
+        self._workers = workers
+        self._executor = None
+        self._pending = []
+
+    @property
+    def done(self):
+        return self.tiles_done == len(self.tiles)
+
+    def start(self):
+        # Spawned workers need only NumPy and the numerical core; main.py skips its Tk imports when re-run in them
+        self._executor = ProcessPoolExecutor(max_workers=self._workers, mp_context=multiprocessing.get_context('spawn'))
+        self._pending = [self._executor.submit(compute_tile, tile) for tile in self.tiles]
+        return self
+
+    def poll(self):
+        """Copy every finished tile into the image; returns the number of new tiles"""
+        finished = [future for future in self._pending if future.done()]
+        for future in finished:
+            self._pending.remove(future)
+            rows, columns, exponents = future.result()
+            self.exponents[rows, columns] = exponents
+        self.tiles_done += len(finished)
+        if self.done:
+            self.shutdown()
+        return len(finished)
+
+    def cancel(self):
+        # Tiles not yet handed to a worker are dropped; Executor.shutdown(cancel_futures=True) needs Python 3.9
+        for future in self._pending:
+            future.cancel()
+        self._pending = []
+        self.shutdown()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def regimes(self):
+        """Regime code per computed cell (see ``LORENZ_REGIMES``), -1 where still pending"""
+        computed = ~np.isnan(self.exponents)
+        return np.where(computed, classify_lorenz_dynamics(np.nan_to_num(self.exponents)), -1)
+
+    def cell_parameters(self, x, y):
+        """(σ, ρ, β) of the grid cell nearest to the point (x, y) of the plane"""
+        params = dict(self.fixed)
+        params[self.x_name] = float(self.x_values[np.abs(self.x_values - x).argmin()])
+        params[self.y_name] = float(self.y_values[np.abs(self.y_values - y).argmin()])
+        return params['sigma'], params['rho'], params['beta']
@@ -0,0 +1,117 @@
+"""
+Lorenz Attractor Visualizer - Performance Instrumentation
+Stage timers, peak memory and a Chrome trace dump; close to free while disabled
+"""
+
+import os
+import json
+import time
+import threading
+import tracemalloc
+from collections import deque
+from contextlib import nullcontext
+
+# Shared by every stage while recording is off, so disabled stages allocate nothing
+_NO_STAGE = nullcontext()
+
+
+class _Stage:
+    __slots__ = ('recorder', 'name', 'start')
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.recorder.record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+
+class PerfRecorder:
+    """Session-wide recorder of named stage timings.
+
+    ``with perf.stage('solve'):`` times a block when recording is enabled and
+    costs a single attribute check otherwise. Events from any thread are kept
+    in a bounded ring buffer and can be written as a Chrome trace
+    (``chrome://tracing`` / Perfetto). With ``track_memory``, ``tracemalloc``
+    also tracks the peak of Python and NumPy allocations; that slows
+    allocation-heavy code noticeably, so it is opt-in.
+    """
+    def __init__(self, max_events=100000):
+        self.enabled = False
+        self.events = deque(maxlen=max_events)
+        self._origin = time.perf_counter()
+
+    def enable(self, track_memory=False):
+        self.enabled = True
+        self.track_memory(track_memory)
+
+    def disable(self):
+        self.enabled = False
+        self.track_memory(False)
+
+    def track_memory(self, on):
+        if on and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif not on and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def stage(self, name):
+        if not self.enabled:
+            return _NO_STAGE
+        return _Stage(self, name)
+
+    def record(self, name, start, duration):
+        self.events.append((name, start, duration, threading.get_ident()))
+
+    def reset(self):
+        self.events.clear()
+        if tracemalloc.is_tracing():
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            else:
+                # Python 3.8 has no reset_peak; restarting the trace clears the peak too
+                tracemalloc.stop()
+                tracemalloc.start()
+
+    @property
+    def peak_memory(self):
+        """Peak traced allocation in bytes since recording started or was reset"""
+        return tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+
+    def summary(self):
+        """Per-stage ``{'count', 'last', 'mean', 'max'}`` in seconds, in order of first use"""
+        stages = {}
+        for name, _, duration, _ in list(self.events):
+            entry = stages.setdefault(name, {'count': 0, 'last': 0.0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['last'] = duration
+            entry['total'] += duration
+            entry['max'] = max(entry['max'], duration)
+        for entry in stages.values():
+            entry['mean'] = entry.pop('total') / entry['count']
+        return stages
+
+    def dump_chrome_trace(self, path):
+        """Write the recorded events in the Chrome trace event format"""
+        main_thread = threading.main_thread().ident
+        trace = [{
+            'name': name,
+            'ph': 'X',
+            'ts': (start - self._origin) * 1e6,
+            'dur': duration * 1e6,
+            'pid': os.getpid(),
+            'tid': 'main' if thread == main_thread else f"worker-{thread}",
+        } for name, start, duration, thread in list(self.events)]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms',
+                       'otherData': {'peak_memory_bytes': self.peak_memory}}, f)
+        return path
+
+
+# Shared recorder used by the GUI
+perf = PerfRecorder()
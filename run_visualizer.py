@@ -4,40 +4,105 @@ Lorenz Attractor Visualizer - Python Launcher
 Direct Python execution without compilation
 """
 
+import time
+_LAUNCH_TIME = time.perf_counter()
+
 import sys
 import os
+import argparse
+import builtins
 import subprocess
+import importlib.util
+
+
+class ImportProfiler:
+    """Time every first-time import made through ``import`` statements.
+
+    Records cumulative and self time per module; self time excludes nested
+    imports, so the breakdown adds up to the total import cost.
+    """
+    def __init__(self):
+        self.records = {}
+        self._stack = []
+        self._original_import = None
+
+    def install(self):
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+        return self
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level != 0 or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            cumulative, self_time = self.records.get(name, (0.0, 0.0))
+            self.records[name] = (cumulative + elapsed, self_time + elapsed - nested)
+
+    def report(self, limit=20):
+        total = sum(self_time for _, self_time in self.records.values())
+        print(f"\n⏱  Import time: {total * 1000:.1f} ms across {len(self.records)} modules")
+        print(f"{'module':<45} {'self ms':>9} {'cumulative ms':>14}")
+        ranked = sorted(self.records.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (cumulative, self_time) in ranked[:limit]:
+            print(f"{name:<45} {self_time * 1000:>9.1f} {cumulative * 1000:>14.1f}")
+
+
+def check_packages():
+    """Find required packages from their metadata without importing them"""
+    # tkinter is only usable when its C extension is present
+    required_packages = {'numpy': 'numpy', 'scipy': 'scipy', 'matplotlib': 'matplotlib', 'tkinter': '_tkinter'}
+    missing_packages = []
+
+    for package, module in required_packages.items():
+        if importlib.util.find_spec(module) is not None:
+            print(f"✓ {package} available")
+        else:
+            missing_packages.append(package)
+            print(f"❌ {package} missing")
+    return missing_packages
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Launch the Lorenz Attractor & Logistic Map Visualizer")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="report per-module import times and time to first window")
+    args = parser.parse_args(argv)
 
-def main():
     print("🔬 Lorenz Attractor & Logistic Map Visualizer")
     print("=" * 50)
-    
-    # Check if we're in the right directory
-    if not os.path.exists('main.py'):
+
+    # Make main.py importable from any working directory
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    if not os.path.exists(os.path.join(project_dir, 'main.py')):
         print("❌ Error: main.py not found!")
-        print("Please run this script from the project directory.")
+        print("Please keep this script in the project directory.")
         return 1
-    
+    sys.path.insert(0, project_dir)
+
     # Check Python version
     if sys.version_info < (3, 8):
         print("❌ Error: Python 3.8 or later required!")
         print(f"Current version: {sys.version}")
         return 1
-    
+
     print(f"✓ Python version: {sys.version.split()[0]}")
-    
+
     # Check required packages
-    required_packages = ['numpy', 'scipy', 'matplotlib', 'tkinter']
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package)
-            print(f"✓ {package} available")
-        except ImportError:
-            missing_packages.append(package)
-            print(f"❌ {package} missing")
-    
+    missing_packages = check_packages()
+
     if missing_packages:
         print(f"\n📦 Installing missing packages: {', '.join(missing_packages)}")
         try:
@@ -51,20 +116,33 @@ def main():
             print(f"❌ Failed to install packages: {e}")
             print("Please install manually: pip install numpy scipy matplotlib")
             return 1
-    
+        importlib.invalidate_caches()
+
     print("\n🚀 Launching Lorenz Attractor Visualizer...")
     print("-" * 50)
-    
+
+    profiler = ImportProfiler().install() if args.profile_startup else None
+    on_ready = None
+    if profiler is not None:
+        def on_ready():
+            first_window = time.perf_counter() - _LAUNCH_TIME
+            profiler.report()
+            print(f"🪟 Time to first window: {first_window * 1000:.1f} ms")
+
     try:
-        # Launch the main application
-        subprocess.run([sys.executable, 'main.py'], check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Application failed to start: {e}")
-        return 1
+        # Launch the application in this interpreter
+        import main as app_main
+        app_main.main(on_ready=on_ready)
     except KeyboardInterrupt:
         print("\n👋 Application closed by user")
         return 0
-    
+    except Exception as e:
+        print(f"❌ Application failed to start: {e}")
+        return 1
+    finally:
+        if profiler is not None:
+            profiler.uninstall()
+
     return 0
 
 if __name__ == "__main__":
@@ -0,0 +1,134 @@
+"""
+Lorenz Attractor Visualizer - Trajectory Store
+Trajectories saved as memory-mapped .npy files with a small JSON metadata header
+"""
+
+import os
+import json
+
+import numpy as np
+
+from chaos_core import CompactTrajectory
+
+STORE_VERSION = 1
+
+
+def metadata_path(path):
+    """Path of the JSON metadata that accompanies a trajectory file"""
+    return os.path.splitext(path)[0] + '.json'
+
+
+def _write_metadata(path, metadata):
+    with open(metadata_path(path), 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+
+class TrajectoryWriter:
+    """Stream trajectory chunks straight into a memory-mapped .npy file.
+
+    The file is preallocated for ``n_samples`` rows; the metadata header is
+    written on ``close`` together with the number of rows actually filled.
+    Rows go to a temporary file next to ``path`` that replaces it on
+    ``close``, so a trajectory memory-mapped from ``path`` can be saved back
+    over itself.
+    """
+    def __init__(self, path, n_samples, metadata=None, dtype=np.float64):
+        self.path = path
+        self.n_samples = n_samples
+        self.metadata = dict(metadata or {})
+        self.position = 0
+        # Created like any other file (mkstemp would leave it private after the rename)
+        self.temp_path = f"{path}.{os.getpid()}.part"
+        self.array = np.lib.format.open_memmap(self.temp_path, mode='w+', dtype=dtype, shape=(n_samples, 3))
+
+    def write(self, states):
+        """Append a (k, 3) chunk of states"""
+        states = np.asarray(states)
+        end = self.position + len(states)
+        if end > self.n_samples:
+            raise ValueError(f"Writing {end} samples into a store sized for {self.n_samples}")
+        self.array[self.position:end] = states
+        self.position = end
+
+    def close(self):
+        if self.array is None:
+            return
+        self.array.flush()
+        self.array = None
+        os.replace(self.temp_path, self.path)
+        metadata = dict(self.metadata, version=STORE_VERSION, n_samples=self.position)
+        _write_metadata(self.path, metadata)
+
+    def abort(self):
+        """Discard the rows written so far and leave ``path`` untouched"""
+        if self.array is None:
+            return
+        self.array = None
+        os.remove(self.temp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+
+def save_trajectory(path, solution, metadata=None, chunk_size=65536, progress=None, check_cancelled=None):
+    """Copy an in-memory or memory-mapped solution into a trajectory store.
+
+    A ``CompactTrajectory`` is written in its stored dtype, with the decoding
+    parameters recorded under ``compact`` in the metadata.
+    """
+    n = len(solution)
+    if isinstance(solution, CompactTrajectory):
+        metadata = dict(metadata or {}, compact=solution.metadata())
+        source = solution.data
+    else:
+        source = solution
+    with TrajectoryWriter(path, n, metadata, dtype=source.dtype) as writer:
+        for start in range(0, n, chunk_size):
+            if check_cancelled is not None:
+                check_cancelled()
+            writer.write(source[start:start + chunk_size])
+            if progress is not None:
+                progress(min(start + chunk_size, n) / n)
+    return path
+
+
+def write_trajectory_chunks(path, chunks, n_samples, metadata=None):
+    """Write ``(t, states)`` chunks, e.g. from ``iter_lorenz_chunks``, as they arrive"""
+    with TrajectoryWriter(path, n_samples, metadata) as writer:
+        for _, states in chunks:
+            writer.write(states)
+    return path
+
+
+def open_trajectory(path, mode='r'):
+    """Open a stored trajectory without loading it; returns ``(array, metadata)``.
+
+    Compact stores come back as a ``CompactTrajectory`` over the memory map.
+    """
+    metadata = {}
+    if os.path.exists(metadata_path(path)):
+        with open(metadata_path(path)) as f:
+            metadata = json.load(f)
+    array = np.load(path, mmap_mode=mode)
+    if array.ndim != 2 or array.shape[1] != 3:
+        raise ValueError(f"{os.path.basename(path)} does not hold an (N, 3) trajectory")
+    n_samples = metadata.get('n_samples', len(array))
+    array = array[:n_samples]
+    compact = metadata.get('compact')
+    if compact is not None:
+        array = CompactTrajectory(array, compact['storage'], compact['scale'], compact['offset'], compact['max_error'])
+    return array, metadata
+
+
+def trajectory_time(metadata, n_samples):
+    """Reconstruct the uniform time grid recorded in the metadata"""
+    t0 = metadata.get('t0', 0.0)
+    dt = metadata.get('dt', 1.0)
+    return t0 + dt * np.arange(n_samples)